@@ -306,12 +306,13 @@ def mix_multiple_ambient_sounds(
 # ---------- Defaults & Paths ----------
 
 
-def default_out_path(binaural_path: str, ambient_key: str | None) -> str:
+def default_out_path(binaural_path: str, ambient_key: str | None, root: str | None = None) -> str:
     """
-    Build a default output path under build/mix/
+    Build a default output path under <root>/build/mix/ (root defaults to project_root())
     Name: <binaural_basename>__<ambient>.wav  (ambient defaults to 'mix' if None)
     """
-    root = project_root()
+    if root is None:
+        root = project_root()
     out_dir = os.path.join(root, "build", "mix")
     os.makedirs(out_dir, exist_ok=True)
     base = os.path.splitext(os.path.basename(binaural_path))[0]
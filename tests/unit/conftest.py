@@ -0,0 +1,90 @@
+"""Shared pytest fixtures for unit tests."""
+
+import struct
+import sys
+import time
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from sleepstack import download_ambient
+
+
+@pytest.fixture(autouse=True)
+def yt_dlp_class(monkeypatch):
+    """Replace yt_dlp.YoutubeDL with a harmless mock so no test can hit the network."""
+    mock_ydl_class = MagicMock()
+    monkeypatch.setattr(download_ambient.yt_dlp, "YoutubeDL", mock_ydl_class)
+    return mock_ydl_class
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make time.sleep return immediately, e.g. to skip read_wav's retry backoff."""
+    monkeypatch.setattr(time, "sleep", lambda _seconds: None)
+
+
+@pytest.fixture
+def set_argv(monkeypatch):
+    """Return a setter that replaces sys.argv for the duration of the test."""
+
+    def _set(args):
+        monkeypatch.setattr(sys, "argv", list(args))
+
+    return _set
+
+
+def _write_silent_wav(path, nchannels, sampwidth, framerate):
+    """Write one second of PCM silence behind a canonical 44-byte RIFF header."""
+    size = nchannels * sampwidth * framerate
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        nchannels,
+        framerate,
+        framerate * nchannels * sampwidth,  # byte rate
+        nchannels * sampwidth,  # block align
+        sampwidth * 8,
+        b"data",
+        size,
+    )
+    path.write_bytes(header + bytes(size))
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def silent_stereo_wav(tmp_path_factory):
+    """Return the path of a 1 second, 48 kHz, 16-bit stereo WAV of silence."""
+    return _write_silent_wav(tmp_path_factory.mktemp("wav") / "silent_stereo.wav", 2, 2, 48000)
+
+
+@pytest.fixture(scope="session")
+def bit8_wav(tmp_path_factory):
+    """Return the path of a 1 second, 48 kHz, 8-bit stereo WAV of silence."""
+    return _write_silent_wav(tmp_path_factory.mktemp("wav") / "bit8.wav", 2, 1, 48000)
+
+
+@pytest.fixture(scope="session")
+def silent_mono_wav(tmp_path_factory):
+    """Return the path of a 1 second, 48 kHz, 16-bit mono WAV of silence."""
+    return _write_silent_wav(tmp_path_factory.mktemp("wav") / "silent_mono.wav", 1, 2, 48000)
+
+
+@pytest.fixture(scope="session")
+def silent_stereo_44k_wav(tmp_path_factory):
+    """Return the path of a 1 second, 44.1 kHz, 16-bit stereo WAV of silence."""
+    return _write_silent_wav(tmp_path_factory.mktemp("wav") / "silent_stereo_44k.wav", 2, 2, 44100)
+
+
+@pytest.fixture(scope="session")
+def ones_stereo():
+    """Return a read-only (100, 2) array of ones; slice or scale it for variants."""
+    data = np.ones((100, 2))
+    data.setflags(write=False)
+    return data
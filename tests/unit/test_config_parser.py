@@ -335,8 +335,11 @@ class TestConfigParser:
         assert "Configuration exported to" in output
 
     @patch("sleepstack.commands.config_parser.get_config_manager")
-    def test_config_export_default_output(self, mock_get_manager):
+    def test_config_export_default_output(self, mock_get_manager, tmp_path, monkeypatch):
         """Test config export with default output file."""
+        # The default file lands in the working directory, so keep it out of the repo
+        monkeypatch.chdir(tmp_path)
+
         # Mock config manager
         mock_manager = Mock()
         mock_config = Mock()
@@ -354,6 +357,7 @@ class TestConfigParser:
                 result = config_export(args)
 
         assert result == 0
+        assert (tmp_path / "sleepstack_config_2023-01-01.json").exists()
         output = mock_stdout.getvalue()
         assert "Configuration exported to" in output
 
@@ -1,10 +1,18 @@
 """Tests for download_ambient.py"""
 
+import builtins
 import pytest
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
+import ffmpeg
+from yt_dlp import YoutubeDL
+
+from sleepstack.asset_manager import AssetManager
+from sleepstack.config import ConfigManager
+from sleepstack.state_manager import StateManager
+from sleepstack import download_ambient as da
 from sleepstack.download_ambient import (
     AmbientDownloadError,
     PrerequisiteError,
@@ -18,31 +26,39 @@ from sleepstack.download_ambient import (
     main,
 )
 
+_TEST_IN = Path("/tmp/input.wav")
+_TEST_OUT = Path("/tmp/output.wav")
+_TEST_AUDIO = Path("/tmp/test_audio")
+_TEST_DIR = Path("/tmp/test")
+
+
+class _MockExtractorError(Exception):
+    """Stand-in for yt_dlp's ExtractorError."""
 
-class TestAmbientDownloadError:
-    """Test AmbientDownloadError exception."""
 
-    def test_ambient_download_error_creation(self):
-        """Test creating AmbientDownloadError."""
-        error = AmbientDownloadError("Test error")
-        assert str(error) == "Test error"
-        assert isinstance(error, Exception)
+class _MockFFmpegError(Exception):
+    """Stand-in for ffmpeg.Error carrying stdout/stderr."""
 
+    def __init__(self, msg, stdout=None, stderr=None):
+        super().__init__(msg)
+        self.stdout = stdout
+        self.stderr = stderr
 
-class TestPrerequisiteError:
-    """Test PrerequisiteError exception."""
 
-    def test_prerequisite_error_creation(self):
-        """Test creating PrerequisiteError."""
-        error = PrerequisiteError("Test error")
-        assert str(error) == "Test error"
-        assert isinstance(error, Exception)
+@pytest.mark.parametrize("exc_cls", [AmbientDownloadError, PrerequisiteError])
+def test_exception_contract(exc_cls):
+    """Test that custom exceptions subclass Exception and keep their message."""
+    assert issubclass(exc_cls, Exception)
+
+    error = exc_cls("Test error")
+    assert str(error) == "Test error"
+    assert isinstance(error, Exception)
 
 
 class TestValidatePrerequisites:
     """Test validate_prerequisites function."""
 
-    @patch("sleepstack.download_ambient.shutil.which")
+    @patch.object(da.shutil, "which")
     def test_validate_prerequisites_success(self, mock_which):
         """Test successful prerequisite validation."""
         mock_which.return_value = "/usr/bin/ffmpeg"
@@ -50,20 +66,22 @@ class TestValidatePrerequisites:
         # Should not raise an exception
         validate_prerequisites()
 
-    @patch("sleepstack.download_ambient.shutil.which")
+    @patch.object(da.shutil, "which")
     def test_validate_prerequisites_yt_dlp_import_error(self, mock_which):
         """Test prerequisite validation when yt-dlp import fails."""
         mock_which.return_value = "/usr/bin/ffmpeg"
 
         # Mock the import to fail
-        with patch("builtins.__import__", side_effect=ImportError("No module named 'yt_dlp'")):
+        with patch.object(
+            builtins, "__import__", side_effect=ImportError("No module named 'yt_dlp'")
+        ):
             with pytest.raises(PrerequisiteError) as exc_info:
                 validate_prerequisites()
             assert "yt-dlp is required but not found" in str(exc_info.value)
 
         mock_which.assert_called_once_with("ffmpeg")
 
-    @patch("sleepstack.download_ambient.shutil.which")
+    @patch.object(da.shutil, "which")
     def test_validate_prerequisites_ffmpeg_missing(self, mock_which):
         """Test prerequisite validation when ffmpeg is missing."""
         mock_which.return_value = None
@@ -75,61 +93,31 @@ class TestValidatePrerequisites:
         mock_which.assert_called_once_with("ffmpeg")
 
 
-class TestValidateYouTubeURL:
-    """Test validate_youtube_url function."""
-
-    def test_validate_youtube_url_valid_www_youtube(self):
-        """Test validation of valid www.youtube.com URL."""
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-        assert validate_youtube_url(url) is True
-
-    def test_validate_youtube_url_valid_youtube_com(self):
-        """Test validation of valid youtube.com URL."""
-        url = "https://youtube.com/watch?v=dQw4w9WgXcQ"
-        assert validate_youtube_url(url) is True
-
-    def test_validate_youtube_url_valid_m_youtube(self):
-        """Test validation of valid m.youtube.com URL."""
-        url = "https://m.youtube.com/watch?v=dQw4w9WgXcQ"
-        assert validate_youtube_url(url) is True
-
-    def test_validate_youtube_url_valid_youtu_be(self):
-        """Test validation of valid youtu.be URL."""
-        url = "https://youtu.be/dQw4w9WgXcQ"
-        assert validate_youtube_url(url) is True
-
-    def test_validate_youtube_url_invalid_domain(self):
-        """Test validation of URL with invalid domain."""
-        url = "https://example.com/watch?v=dQw4w9WgXcQ"
-        assert validate_youtube_url(url) is False
-
-    def test_validate_youtube_url_invalid_youtu_be_no_path(self):
-        """Test validation of youtu.be URL without path."""
-        url = "https://youtu.be/"
-        assert validate_youtube_url(url) is False
-
-    def test_validate_youtube_url_invalid_youtube_no_v(self):
-        """Test validation of youtube.com URL without v parameter."""
-        url = "https://www.youtube.com/watch"
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", True),
+        ("https://youtube.com/watch?v=dQw4w9WgXcQ", True),
+        ("https://m.youtube.com/watch?v=dQw4w9WgXcQ", True),
+        ("https://youtu.be/dQw4w9WgXcQ", True),
+        ("https://example.com/watch?v=dQw4w9WgXcQ", False),
+        ("https://youtu.be/", False),
         # The current implementation accepts this as valid because it has '/watch' in path
-        assert validate_youtube_url(url) is True
-
-    def test_validate_youtube_url_empty_url(self):
-        """Test validation of empty URL."""
-        assert validate_youtube_url("") is False
-        assert validate_youtube_url(None) is False
-
-    def test_validate_youtube_url_malformed_url(self):
-        """Test validation of malformed URL."""
-        url = "not-a-url"
-        assert validate_youtube_url(url) is False
+        ("https://www.youtube.com/watch", True),
+        ("", False),
+        (None, False),
+        ("not-a-url", False),
+    ],
+)
+def test_validate_youtube_url(url, expected):
+    """Test validate_youtube_url across valid and invalid URLs."""
+    assert validate_youtube_url(url) is expected
 
 
 class TestGetVideoInfo:
     """Test get_video_info function."""
 
-    @patch("sleepstack.download_ambient.yt_dlp.YoutubeDL")
-    def test_get_video_info_success(self, mock_ydl_class):
+    def test_get_video_info_success(self, yt_dlp_class):
         """Test successful video info retrieval."""
         # Mock video info
         mock_info = {
@@ -142,9 +130,9 @@ class TestGetVideoInfo:
         }
 
         # Mock YoutubeDL instance
-        mock_ydl = Mock()
+        mock_ydl = MagicMock(spec=YoutubeDL)
         mock_ydl.extract_info.return_value = mock_info
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        yt_dlp_class.return_value.__enter__.return_value = mock_ydl
 
         url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         result = get_video_info(url)
@@ -156,42 +144,33 @@ class TestGetVideoInfo:
         assert result["view_count"] == 1000
         assert result["upload_date"] == "20240101"
 
-    @patch("sleepstack.download_ambient.yt_dlp.YoutubeDL")
-    def test_get_video_info_download_error(self, mock_ydl_class):
+    def test_get_video_info_download_error(self, yt_dlp_class):
         """Test get_video_info with DownloadError."""
         from yt_dlp import DownloadError
 
-        mock_ydl = Mock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl = MagicMock(spec=YoutubeDL)
+        yt_dlp_class.return_value.__enter__.return_value = mock_ydl
         mock_ydl.extract_info.side_effect = DownloadError("Network error")
 
         with pytest.raises(AmbientDownloadError) as exc_info:
             get_video_info("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
         assert "Failed to get video info: Network error" in str(exc_info.value)
 
-    @patch("sleepstack.download_ambient.yt_dlp.YoutubeDL")
-    def test_get_video_info_extractor_error(self, mock_ydl_class):
+    def test_get_video_info_extractor_error(self, yt_dlp_class):
         """Test get_video_info with ExtractorError."""
+        mock_extractor_error = _MockExtractorError("Invalid URL")
 
-        # Create a mock that will be caught by the except clause
-        class MockExtractorError(Exception):
-            pass
-
-        # Make it so the exception is caught by the except clause
-        mock_extractor_error = MockExtractorError("Invalid URL")
-
-        mock_ydl = Mock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl = MagicMock(spec=YoutubeDL)
+        yt_dlp_class.return_value.__enter__.return_value = mock_ydl
         mock_ydl.extract_info.side_effect = mock_extractor_error
 
         # Patch the ExtractorError import to include our mock
-        with patch("sleepstack.download_ambient.ExtractorError", MockExtractorError):
+        with patch.object(da, "ExtractorError", _MockExtractorError):
             with pytest.raises(AmbientDownloadError) as exc_info:
                 get_video_info("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
             assert "Failed to get video info: Invalid URL" in str(exc_info.value)
 
-    @patch("sleepstack.download_ambient.yt_dlp.YoutubeDL")
-    def test_get_video_info_missing_fields(self, mock_ydl_class):
+    def test_get_video_info_missing_fields(self, yt_dlp_class):
         """Test video info retrieval with missing fields."""
         # Mock video info with missing fields
         mock_info = {
@@ -200,9 +179,9 @@ class TestGetVideoInfo:
         }
 
         # Mock YoutubeDL instance
-        mock_ydl = Mock()
+        mock_ydl = MagicMock(spec=YoutubeDL)
         mock_ydl.extract_info.return_value = mock_info
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        yt_dlp_class.return_value.__enter__.return_value = mock_ydl
 
         url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         result = get_video_info(url)
@@ -224,134 +203,79 @@ class TestGetVideoInfo:
         assert "Invalid YouTube URL" in str(exc_info.value)
 
 
-class TestSanitizeSoundName:
-    """Test sanitize_sound_name function."""
-
-    def test_sanitize_sound_name_valid(self):
-        """Test sanitizing valid sound name."""
-        name = "campfire_sounds"
-        result = sanitize_sound_name(name)
-        assert result == "campfire_sounds"
-
-    def test_sanitize_sound_name_with_invalid_chars(self):
-        """Test sanitizing sound name with invalid characters."""
-        name = "camp<fire>sounds"
-        result = sanitize_sound_name(name)
-        assert result == "camp_fire_sounds"
-
-    def test_sanitize_sound_name_with_slashes(self):
-        """Test sanitizing sound name with slashes."""
-        name = "camp/fire\\sounds"
-        result = sanitize_sound_name(name)
-        assert result == "camp_fire_sounds"
-
-    def test_sanitize_sound_name_with_quotes(self):
-        """Test sanitizing sound name with quotes."""
-        name = 'camp"fire"sounds'
-        result = sanitize_sound_name(name)
-        assert result == "camp_fire_sounds"
-
-    def test_sanitize_sound_name_with_whitespace(self):
-        """Test sanitizing sound name with whitespace."""
-        name = "  camp fire sounds  "
-        result = sanitize_sound_name(name)
-        # The function doesn't replace spaces with underscores, only strips them
-        assert result == "camp fire sounds"
-
-    def test_sanitize_sound_name_with_dots(self):
-        """Test sanitizing sound name with dots."""
-        name = "...camp.fire.sounds..."
-        result = sanitize_sound_name(name)
-        # The function doesn't replace dots with underscores, only strips them
-        assert result == "camp.fire.sounds"
-
-    def test_sanitize_sound_name_multiple_underscores(self):
-        """Test sanitizing sound name with multiple underscores."""
-        name = "camp___fire____sounds"
-        result = sanitize_sound_name(name)
-        assert result == "camp_fire_sounds"
-
-    def test_sanitize_sound_name_empty(self):
-        """Test sanitizing empty sound name."""
-        name = ""
-        result = sanitize_sound_name(name)
-        assert result == "ambient_sound"
-
-    def test_sanitize_sound_name_only_invalid_chars(self):
-        """Test sanitizing sound name with only invalid characters."""
-        name = '<>:"/\\|?*'
-        result = sanitize_sound_name(name)
-        # After replacing invalid chars with underscores and collapsing, we get just "_"
-        assert result == "_"
-
-    def test_sanitize_sound_name_only_whitespace(self):
-        """Test sanitizing sound name with only whitespace."""
-        name = "   "
-        result = sanitize_sound_name(name)
-        assert result == "ambient_sound"
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("campfire_sounds", "campfire_sounds"),
+        ("camp<fire>sounds", "camp_fire_sounds"),
+        ("camp/fire\\sounds", "camp_fire_sounds"),
+        ('camp"fire"sounds', "camp_fire_sounds"),
+        # Spaces are not replaced with underscores, only stripped
+        ("  camp fire sounds  ", "camp fire sounds"),
+        # Dots are not replaced with underscores, only stripped
+        ("...camp.fire.sounds...", "camp.fire.sounds"),
+        ("camp___fire____sounds", "camp_fire_sounds"),
+        ("", "ambient_sound"),
+        # Invalid chars become underscores and collapse to a single "_"
+        ('<>:"/\\|?*', "_"),
+        ("   ", "ambient_sound"),
+    ],
+)
+def test_sanitize_sound_name(name, expected):
+    """Test sanitize_sound_name across valid and invalid names."""
+    assert sanitize_sound_name(name) == expected
 
 
 class TestDownloadAudio:
     """Test download_audio function."""
 
-    @patch("sleepstack.download_ambient.yt_dlp.YoutubeDL")
-    def test_download_audio_success(self, mock_ydl_class):
+    def test_download_audio_success(self, yt_dlp_class):
         """Test successful audio download."""
         # Mock YoutubeDL instance
-        mock_ydl = Mock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl = MagicMock(spec=YoutubeDL)
+        yt_dlp_class.return_value.__enter__.return_value = mock_ydl
 
         url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-        output_path = Path("/tmp/test_audio")
-
-        download_audio(url, output_path)
+        download_audio(url, _TEST_AUDIO)
 
         mock_ydl.download.assert_called_once_with([url])
 
-    @patch("sleepstack.download_ambient.yt_dlp.YoutubeDL")
-    def test_download_audio_download_error(self, mock_ydl_class):
+    def test_download_audio_download_error(self, yt_dlp_class):
         """Test download_audio with DownloadError."""
         from yt_dlp import DownloadError
 
-        mock_ydl = Mock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl = MagicMock(spec=YoutubeDL)
+        yt_dlp_class.return_value.__enter__.return_value = mock_ydl
         mock_ydl.download.side_effect = DownloadError("Download failed")
 
         with pytest.raises(AmbientDownloadError) as exc_info:
-            download_audio("https://www.youtube.com/watch?v=test", Path("/tmp/test"))
+            download_audio("https://www.youtube.com/watch?v=test", _TEST_DIR)
         assert "Failed to download audio: Download failed" in str(exc_info.value)
 
-    @patch("sleepstack.download_ambient.yt_dlp.YoutubeDL")
-    def test_download_audio_extractor_error(self, mock_ydl_class):
+    def test_download_audio_extractor_error(self, yt_dlp_class):
         """Test download_audio with ExtractorError."""
+        mock_extractor_error = _MockExtractorError("Invalid URL")
 
-        # Create a mock that will be caught by the except clause
-        class MockExtractorError(Exception):
-            pass
-
-        # Make it so the exception is caught by the except clause
-        mock_extractor_error = MockExtractorError("Invalid URL")
-
-        mock_ydl = Mock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl = MagicMock(spec=YoutubeDL)
+        yt_dlp_class.return_value.__enter__.return_value = mock_ydl
         mock_ydl.download.side_effect = mock_extractor_error
 
         # Patch the ExtractorError import to include our mock
-        with patch("sleepstack.download_ambient.ExtractorError", MockExtractorError):
+        with patch.object(da, "ExtractorError", _MockExtractorError):
             with pytest.raises(AmbientDownloadError) as exc_info:
-                download_audio("https://www.youtube.com/watch?v=test", Path("/tmp/test"))
+                download_audio("https://www.youtube.com/watch?v=test", _TEST_DIR)
             assert "Failed to download audio: Invalid URL" in str(exc_info.value)
 
 
 class TestProcessAudio:
     """Test process_audio function."""
 
-    @patch("sleepstack.download_ambient.ffmpeg")
+    @patch.object(da, "ffmpeg", spec=ffmpeg)
     def test_process_audio_success(self, mock_ffmpeg):
         """Test successful audio processing."""
         # Mock ffmpeg pipeline
-        mock_input = Mock()
-        mock_output = Mock()
+        mock_input = Mock(spec=ffmpeg.nodes.FilterableStream)
+        mock_output = Mock(spec=ffmpeg.nodes.OutputStream)
         mock_run = Mock()
 
         mock_ffmpeg.input.return_value = mock_input
@@ -359,22 +283,19 @@ class TestProcessAudio:
         mock_output.overwrite_output.return_value = mock_output
         mock_output.run = mock_run
 
-        input_path = Path("/tmp/input.wav")
-        output_path = Path("/tmp/output.wav")
-
-        process_audio(input_path, output_path)
+        process_audio(_TEST_IN, _TEST_OUT)
 
-        mock_ffmpeg.input.assert_called_once_with(str(input_path))
+        mock_ffmpeg.input.assert_called_once_with(str(_TEST_IN))
         mock_input.output.assert_called_once()
         mock_output.overwrite_output.assert_called_once()
         mock_run.assert_called_once_with(quiet=True, capture_stdout=True, capture_stderr=True)
 
-    @patch("sleepstack.download_ambient.ffmpeg")
+    @patch.object(da, "ffmpeg", spec=ffmpeg)
     def test_process_audio_custom_params(self, mock_ffmpeg):
         """Test audio processing with custom parameters."""
         # Mock ffmpeg pipeline
-        mock_input = Mock()
-        mock_output = Mock()
+        mock_input = Mock(spec=ffmpeg.nodes.FilterableStream)
+        mock_output = Mock(spec=ffmpeg.nodes.OutputStream)
         mock_run = Mock()
 
         mock_ffmpeg.input.return_value = mock_input
@@ -382,38 +303,28 @@ class TestProcessAudio:
         mock_output.overwrite_output.return_value = mock_output
         mock_output.run = mock_run
 
-        input_path = Path("/tmp/input.wav")
-        output_path = Path("/tmp/output.wav")
+        process_audio(_TEST_IN, _TEST_OUT, start_time=30, duration=90, sample_rate=44100)
 
-        process_audio(input_path, output_path, start_time=30, duration=90, sample_rate=44100)
+        mock_ffmpeg.input.assert_called_once_with(str(_TEST_IN))
 
-        mock_ffmpeg.input.assert_called_once_with(str(input_path))
-
-    @patch("sleepstack.download_ambient.ffmpeg")
+    @patch.object(da, "ffmpeg", spec=ffmpeg)
     def test_process_audio_ffmpeg_error(self, mock_ffmpeg):
         """Test process_audio with ffmpeg error."""
         # Mock ffmpeg pipeline that raises an error
-        mock_input = Mock()
-        mock_output = Mock()
+        mock_input = Mock(spec=ffmpeg.nodes.FilterableStream)
+        mock_output = Mock(spec=ffmpeg.nodes.OutputStream)
         mock_run = Mock()
 
         mock_ffmpeg.input.return_value = mock_input
         mock_input.output.return_value = mock_output
         mock_output.overwrite_output.return_value = mock_output
 
-        # Create a proper ffmpeg.Error mock
-        class MockFFmpegError(Exception):
-            def __init__(self, msg, stdout=None, stderr=None):
-                super().__init__(msg)
-                self.stdout = stdout
-                self.stderr = stderr
-
-        mock_ffmpeg.Error = MockFFmpegError
-        mock_run.side_effect = MockFFmpegError("ffmpeg error")
+        mock_ffmpeg.Error = _MockFFmpegError
+        mock_run.side_effect = _MockFFmpegError("ffmpeg error")
         mock_output.run = mock_run
 
         with pytest.raises(AmbientDownloadError) as exc_info:
-            process_audio(Path("/tmp/input.wav"), Path("/tmp/output.wav"))
+            process_audio(_TEST_IN, _TEST_OUT)
         assert "Failed to process audio: ffmpeg error" in str(exc_info.value)
 
 
@@ -431,7 +342,7 @@ class TestDownloadAndProcessAmbientSound:
 
         shutil.rmtree(self.temp_dir)
 
-    @patch("sleepstack.download_ambient.validate_prerequisites")
+    @patch.object(da, "validate_prerequisites")
     def test_download_and_process_prerequisite_error(self, mock_validate):
         """Test download and process with prerequisite error."""
         mock_validate.side_effect = PrerequisiteError("ffmpeg not found")
@@ -442,7 +353,7 @@ class TestDownloadAndProcessAmbientSound:
         with pytest.raises(PrerequisiteError):
             download_and_process_ambient_sound(url, sound_name, self.assets_dir)
 
-    @patch("sleepstack.download_ambient.validate_prerequisites")
+    @patch.object(da, "validate_prerequisites")
     def test_download_and_process_file_exists(self, mock_validate):
         """Test download and process when file already exists."""
         # Create existing file
@@ -460,11 +371,11 @@ class TestDownloadAndProcessAmbientSound:
         assert "already exists" in str(exc_info.value)
 
     @pytest.mark.skip(reason="Complex mocking issues with Path.exists")
-    @patch("sleepstack.download_ambient.validate_prerequisites")
-    @patch("sleepstack.download_ambient.get_video_info")
-    @patch("sleepstack.download_ambient.download_audio")
-    @patch("sleepstack.download_ambient.process_audio")
-    @patch("uuid.uuid4")
+    @patch.object(da, "validate_prerequisites")
+    @patch.object(da, "get_video_info")
+    @patch.object(da, "download_audio")
+    @patch.object(da, "process_audio")
+    @patch.object(da.uuid, "uuid4")
     def test_download_and_process_default_assets_dir(
         self, mock_uuid, mock_process, mock_download, mock_get_info, mock_validate
     ):
@@ -476,13 +387,13 @@ class TestDownloadAndProcessAmbientSound:
         mock_get_info.return_value = {"duration": 300}
 
         # Mock file operations
-        with patch("tempfile.gettempdir", return_value="/tmp"):
-            with patch("pathlib.Path.mkdir"):
-                with patch("pathlib.Path.exists") as mock_exists:
+        with patch.object(da.tempfile, "gettempdir", return_value="/tmp"):
+            with patch.object(Path, "mkdir"):
+                with patch.object(Path, "exists") as mock_exists:
                     # Mock exists to return False for all files
                     mock_exists.return_value = False
 
-                    with patch("pathlib.Path.parent") as mock_parent:
+                    with patch.object(Path, "parent") as mock_parent:
                         mock_parent.return_value.glob.return_value = [
                             Path("/tmp/sleepstack_download_test123.mp3")
                         ]
@@ -501,14 +412,14 @@ class TestDownloadAndProcessAmbientSound:
     @pytest.mark.skip(
         reason="Complex mocking issue - function catches AmbientDownloadError and continues"
     )
-    @patch("sleepstack.download_ambient.validate_prerequisites")
-    @patch("sleepstack.download_ambient.get_video_info")
-    @patch("sleepstack.download_ambient.download_audio")
-    @patch("sleepstack.download_ambient.process_audio")
-    @patch("sleepstack.download_ambient.get_asset_manager")
-    @patch("sleepstack.download_ambient.get_config_manager")
-    @patch("sleepstack.download_ambient.get_state_manager")
-    @patch("uuid.uuid4")
+    @patch.object(da, "validate_prerequisites")
+    @patch.object(da, "get_video_info")
+    @patch.object(da, "download_audio")
+    @patch.object(da, "process_audio")
+    @patch.object(da, "get_asset_manager")
+    @patch.object(da, "get_config_manager")
+    @patch.object(da, "get_state_manager")
+    @patch.object(da.uuid, "uuid4")
     def test_download_and_process_short_video_error(
         self,
         mock_uuid,
@@ -527,9 +438,9 @@ class TestDownloadAndProcessAmbientSound:
         )
 
         # Mock managers
-        mock_get_asset.return_value = Mock()
-        mock_get_config.return_value = Mock()
-        mock_get_state.return_value = Mock()
+        mock_get_asset.return_value = Mock(spec=AssetManager)
+        mock_get_config.return_value = Mock(spec=ConfigManager)
+        mock_get_state.return_value = Mock(spec=StateManager)
 
         url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         sound_name = "test_sound"
@@ -539,15 +450,15 @@ class TestDownloadAndProcessAmbientSound:
 
         assert "Video is too short" in str(exc_info.value)
 
-    @patch("sleepstack.download_ambient.validate_prerequisites")
-    @patch("sleepstack.download_ambient.get_video_info")
-    @patch("sleepstack.download_ambient.download_audio")
-    @patch("sleepstack.download_ambient.process_audio")
-    @patch("sleepstack.download_ambient.get_asset_manager")
-    @patch("sleepstack.download_ambient.get_config_manager")
-    @patch("sleepstack.download_ambient.get_state_manager")
-    @patch("sleepstack.download_ambient.get_cached_audio")
-    @patch("uuid.uuid4")
+    @patch.object(da, "validate_prerequisites")
+    @patch.object(da, "get_video_info")
+    @patch.object(da, "download_audio")
+    @patch.object(da, "process_audio")
+    @patch.object(da, "get_asset_manager")
+    @patch.object(da, "get_config_manager")
+    @patch.object(da, "get_state_manager")
+    @patch.object(da, "get_cached_audio")
+    @patch.object(da.uuid, "uuid4")
     def test_download_and_process_no_downloaded_file(
         self,
         mock_uuid,
@@ -571,15 +482,15 @@ class TestDownloadAndProcessAmbientSound:
         mock_get_cached_audio.return_value = None
 
         # Mock managers
-        mock_get_asset.return_value = Mock()
-        mock_get_config.return_value = Mock()
-        mock_get_state.return_value = Mock()
+        mock_get_asset.return_value = Mock(spec=AssetManager)
+        mock_get_config.return_value = Mock(spec=ConfigManager)
+        mock_get_state.return_value = Mock(spec=StateManager)
 
         # Mock file operations to simulate no downloaded file
-        with patch("tempfile.gettempdir", return_value="/tmp"):
-            with patch("pathlib.Path.mkdir"):
-                with patch("pathlib.Path.exists", return_value=False):
-                    with patch("pathlib.Path.parent") as mock_parent:
+        with patch.object(da.tempfile, "gettempdir", return_value="/tmp"):
+            with patch.object(Path, "mkdir"):
+                with patch.object(Path, "exists", return_value=False):
+                    with patch.object(Path, "parent") as mock_parent:
                         mock_parent.return_value.glob.return_value = []  # No files found
 
                         url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
@@ -598,66 +509,57 @@ class TestMain:
         """Test that main function exists and can be called."""
         assert callable(main)
 
-    @patch(
-        "sys.argv", ["download_ambient.py", "https://www.youtube.com/watch?v=test", "test_sound"]
-    )
-    @patch("sleepstack.download_ambient.download_and_process_ambient_sound")
-    @patch("sys.exit")
-    def test_main_success(self, mock_exit, mock_download):
+    @patch.object(da, "download_and_process_ambient_sound")
+    def test_main_success(self, mock_download, set_argv):
         """Test main function with successful download."""
+        set_argv(["download_ambient.py", "https://www.youtube.com/watch?v=test", "test_sound"])
         mock_download.return_value = Path("/path/to/test_sound_1m.wav")
 
-        with patch("builtins.print") as mock_print:
+        with patch.object(builtins, "print") as mock_print:
             main()
 
         mock_download.assert_called_once_with("https://www.youtube.com/watch?v=test", "test_sound")
         mock_print.assert_called_once_with(
             "Successfully downloaded and processed: /path/to/test_sound_1m.wav"
         )
-        mock_exit.assert_not_called()
 
-    @patch("sys.argv", ["download_ambient.py", "https://www.youtube.com/watch?v=test"])
-    @patch("sys.exit")
-    def test_main_wrong_args(self, mock_exit):
+    def test_main_wrong_args(self, set_argv):
         """Test main function with wrong number of arguments."""
-        with patch("builtins.print") as mock_print:
-            with pytest.raises(IndexError):
+        set_argv(["download_ambient.py", "https://www.youtube.com/watch?v=test"])
+        with patch.object(builtins, "print") as mock_print:
+            with pytest.raises(SystemExit) as exc_info:
                 main()
 
         mock_print.assert_called_once_with(
             "Usage: python download_ambient.py <youtube_url> <sound_name>"
         )
-        mock_exit.assert_called_once_with(1)
+        assert exc_info.value.code == 1
 
-    @patch(
-        "sys.argv", ["download_ambient.py", "https://www.youtube.com/watch?v=test", "test_sound"]
-    )
-    @patch("sleepstack.download_ambient.download_and_process_ambient_sound")
-    @patch("sys.exit")
-    def test_main_download_error(self, mock_exit, mock_download):
+    @patch.object(da, "download_and_process_ambient_sound")
+    def test_main_download_error(self, mock_download, set_argv):
         """Test main function with download error."""
+        set_argv(["download_ambient.py", "https://www.youtube.com/watch?v=test", "test_sound"])
         mock_download.side_effect = AmbientDownloadError("Download failed")
 
-        with patch("builtins.print") as mock_print:
-            main()
+        with patch.object(builtins, "print") as mock_print:
+            with pytest.raises(SystemExit) as exc_info:
+                main()
 
         mock_print.assert_called_once_with("Error: Download failed")
-        mock_exit.assert_called_once_with(1)
+        assert exc_info.value.code == 1
 
-    @patch(
-        "sys.argv", ["download_ambient.py", "https://www.youtube.com/watch?v=test", "test_sound"]
-    )
-    @patch("sleepstack.download_ambient.download_and_process_ambient_sound")
-    @patch("sys.exit")
-    def test_main_prerequisite_error(self, mock_exit, mock_download):
+    @patch.object(da, "download_and_process_ambient_sound")
+    def test_main_prerequisite_error(self, mock_download, set_argv):
         """Test main function with prerequisite error."""
+        set_argv(["download_ambient.py", "https://www.youtube.com/watch?v=test", "test_sound"])
         mock_download.side_effect = PrerequisiteError("ffmpeg not found")
 
-        with patch("builtins.print") as mock_print:
-            main()
+        with patch.object(builtins, "print") as mock_print:
+            with pytest.raises(SystemExit) as exc_info:
+                main()
 
         mock_print.assert_called_once_with("Error: ffmpeg not found")
-        mock_exit.assert_called_once_with(1)
+        assert exc_info.value.code == 1
 
 
 class TestIntegration:
@@ -714,15 +616,3 @@ class TestIntegration:
 
         for url in invalid_urls:
             assert validate_youtube_url(url) is False, f"URL should be invalid: {url}"
-
-    def test_exception_hierarchy(self):
-        """Test that custom exceptions inherit from Exception."""
-        assert issubclass(AmbientDownloadError, Exception)
-        assert issubclass(PrerequisiteError, Exception)
-
-        # Test instantiation
-        ambient_error = AmbientDownloadError("test")
-        prerequisite_error = PrerequisiteError("test")
-
-        assert isinstance(ambient_error, Exception)
-        assert isinstance(prerequisite_error, Exception)
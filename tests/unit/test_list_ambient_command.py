@@ -1,409 +1,211 @@
 """Tests for commands/list_ambient.py"""
 
+import argparse
+
 import pytest
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
+from sleepstack.ambient_manager import AmbientSoundManager
 from sleepstack.commands.list_ambient import (
     list_ambient_command,
     add_list_ambient_parser,
 )
 
+_CAMPFIRE = {
+    "name": "campfire",
+    "path": "/path/to/campfire.wav",
+    "duration": "60.0s",
+    "sample_rate": "48000 Hz",
+    "file_size": "1.2 MB",
+    "source_url": "https://example.com",
+    "description": "Crackling campfire sounds",
+}
+_RAIN = {
+    "name": "rain",
+    "path": "/path/to/rain.wav",
+    "duration": "60.0s",
+    "sample_rate": "48000 Hz",
+    "file_size": "1.1 MB",
+    "source_url": None,
+    "description": "Gentle rain sounds",
+}
+# Optional fields left empty
+_RAIN_NO_DETAILS = {**_RAIN, "description": None}
+_OCEAN = {
+    "name": "ocean",
+    "path": "/path/to/ocean.wav",
+    "duration": "60.0s",
+    "sample_rate": "48000 Hz",
+    "file_size": "1.0 MB",
+    "source_url": "https://ocean.com",
+    "description": None,
+}
+
+# Built once and reset per test; Mock construction dominates the cost of these tests
+_PROTO_MANAGER = Mock(spec=AmbientSoundManager)
+
+
+@pytest.fixture
+def mock_manager():
+    """Return the shared ambient manager mock, reset for this test."""
+    _PROTO_MANAGER.reset_mock(return_value=True, side_effect=True)
+    return _PROTO_MANAGER
+
+
+@pytest.fixture(scope="module")
+def assets_dir(tmp_path_factory):
+    """Return an empty temporary assets directory shared by the integration tests."""
+    return tmp_path_factory.mktemp("ambience")
+
+
+@pytest.fixture(scope="module")
+def real_manager(assets_dir):
+    """Return a real ambient manager backed by the shared assets directory."""
+    return AmbientSoundManager(assets_dir)
+
+
+@pytest.fixture(scope="module")
+def configured_parser():
+    """Return a real argparse parser with the list-ambient subcommand registered."""
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers()
+    add_list_ambient_parser(subparsers)
+    return parser
+
+
+# list_ambient_command
+
+
+@pytest.mark.parametrize(
+    "detailed, method_name, return_value",
+    [
+        pytest.param(False, "get_available_sounds", ["campfire", "rain", "ocean"], id="simple"),
+        pytest.param(False, "get_available_sounds", [], id="simple_empty"),
+        pytest.param(False, "get_available_sounds", ["campfire"], id="simple_single"),
+        pytest.param(True, "list_sounds_with_details", [_CAMPFIRE, _RAIN], id="detailed"),
+        pytest.param(True, "list_sounds_with_details", [], id="detailed_empty"),
+        pytest.param(True, "list_sounds_with_details", [_CAMPFIRE], id="detailed_single"),
+        pytest.param(
+            True,
+            "list_sounds_with_details",
+            [_CAMPFIRE, _RAIN_NO_DETAILS, _OCEAN],
+            id="detailed_optional_fields",
+        ),
+    ],
+)
+def test_list_ambient(mocker, mock_manager, detailed, method_name, return_value):
+    """Test successful simple and detailed listing of ambient sounds."""
+    mock_get_ambient_manager = mocker.patch("sleepstack.commands.list_ambient.get_ambient_manager")
+    mock_get_ambient_manager.return_value = mock_manager
+    getattr(mock_manager, method_name).return_value = return_value
+    args = SimpleNamespace(detailed=detailed)
+
+    result = list_ambient_command(args)
+
+    assert result == 0
+    getattr(mock_manager, method_name).assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "detailed, target",
+    [
+        # None means get_ambient_manager itself raises
+        pytest.param(False, None, id="manager"),
+        pytest.param(False, "get_available_sounds", id="simple"),
+        pytest.param(True, "list_sounds_with_details", id="detailed"),
+    ],
+)
+def test_list_ambient_error(mocker, mock_manager, detailed, target):
+    """Test handling of errors raised while fetching the manager or listing sounds."""
+    mock_get_ambient_manager = mocker.patch("sleepstack.commands.list_ambient.get_ambient_manager")
+    mock_get_ambient_manager.return_value = mock_manager
+    failing = mock_get_ambient_manager if target is None else getattr(mock_manager, target)
+    failing.side_effect = Exception("List error")
+    args = SimpleNamespace(detailed=detailed)
+
+    result = list_ambient_command(args)
+
+    assert result == 1
+    failing.assert_called_once()
+
+
+# add_list_ambient_parser
+
+
+def test_add_list_ambient_parser():
+    """Test adding the list-ambient parser."""
+    # Create mock subparsers
+    mock_subparsers = Mock()
+    mock_parser = Mock()
+    mock_subparsers.add_parser.return_value = mock_parser
 
-class TestListAmbientCommand:
-    """Test list_ambient_command function."""
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.assets_dir = Path(self.temp_dir) / "ambience"
-        self.assets_dir.mkdir(parents=True)
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
-
-    @patch("sleepstack.commands.list_ambient.get_ambient_manager")
-    def test_list_ambient_simple_success(self, mock_get_ambient_manager):
-        """Test successful simple listing of ambient sounds."""
-        # Mock ambient manager
-        mock_manager = Mock()
-        mock_get_ambient_manager.return_value = mock_manager
-        mock_manager.get_available_sounds.return_value = ["campfire", "rain", "ocean"]
-
-        # Create args
-        args = Mock()
-        args.detailed = False
-
-        # Test command
-        result = list_ambient_command(args)
-
-        assert result == 0
-        mock_get_ambient_manager.assert_called_once()
-        mock_manager.get_available_sounds.assert_called_once()
-
-    @patch("sleepstack.commands.list_ambient.get_ambient_manager")
-    def test_list_ambient_detailed_success(self, mock_get_ambient_manager):
-        """Test successful detailed listing of ambient sounds."""
-        # Mock ambient manager
-        mock_manager = Mock()
-        mock_get_ambient_manager.return_value = mock_manager
-
-        # Mock detailed sounds data
-        mock_sounds = [
-            {
-                "name": "campfire",
-                "path": "/path/to/campfire.wav",
-                "duration": "60.0s",
-                "sample_rate": "48000 Hz",
-                "file_size": "1.2 MB",
-                "source_url": "https://example.com",
-                "description": "Crackling campfire sounds",
-            },
-            {
-                "name": "rain",
-                "path": "/path/to/rain.wav",
-                "duration": "60.0s",
-                "sample_rate": "48000 Hz",
-                "file_size": "1.1 MB",
-                "source_url": None,
-                "description": "Gentle rain sounds",
-            },
-        ]
-        mock_manager.list_sounds_with_details.return_value = mock_sounds
-
-        # Create args
-        args = Mock()
-        args.detailed = True
-
-        # Test command
-        result = list_ambient_command(args)
-
-        assert result == 0
-        mock_get_ambient_manager.assert_called_once()
-        mock_manager.list_sounds_with_details.assert_called_once()
-
-    @patch("sleepstack.commands.list_ambient.get_ambient_manager")
-    def test_list_ambient_simple_empty(self, mock_get_ambient_manager):
-        """Test simple listing when no sounds are available."""
-        # Mock ambient manager
-        mock_manager = Mock()
-        mock_get_ambient_manager.return_value = mock_manager
-        mock_manager.get_available_sounds.return_value = []
-
-        # Create args
-        args = Mock()
-        args.detailed = False
-
-        # Test command
-        result = list_ambient_command(args)
-
-        assert result == 0
-        mock_get_ambient_manager.assert_called_once()
-        mock_manager.get_available_sounds.assert_called_once()
-
-    @patch("sleepstack.commands.list_ambient.get_ambient_manager")
-    def test_list_ambient_detailed_empty(self, mock_get_ambient_manager):
-        """Test detailed listing when no sounds are available."""
-        # Mock ambient manager
-        mock_manager = Mock()
-        mock_get_ambient_manager.return_value = mock_manager
-        mock_manager.list_sounds_with_details.return_value = []
-
-        # Create args
-        args = Mock()
-        args.detailed = True
-
-        # Test command
-        result = list_ambient_command(args)
-
-        assert result == 0
-        mock_get_ambient_manager.assert_called_once()
-        mock_manager.list_sounds_with_details.assert_called_once()
-
-    @patch("sleepstack.commands.list_ambient.get_ambient_manager")
-    def test_list_ambient_detailed_with_optional_fields(self, mock_get_ambient_manager):
-        """Test detailed listing with sounds that have optional fields."""
-        # Mock ambient manager
-        mock_manager = Mock()
-        mock_get_ambient_manager.return_value = mock_manager
-
-        # Mock detailed sounds data with optional fields
-        mock_sounds = [
-            {
-                "name": "campfire",
-                "path": "/path/to/campfire.wav",
-                "duration": "60.0s",
-                "sample_rate": "48000 Hz",
-                "file_size": "1.2 MB",
-                "source_url": "https://example.com",
-                "description": "Crackling campfire sounds",
-            },
-            {
-                "name": "rain",
-                "path": "/path/to/rain.wav",
-                "duration": "60.0s",
-                "sample_rate": "48000 Hz",
-                "file_size": "1.1 MB",
-                "source_url": None,  # No source URL
-                "description": None,  # No description
-            },
-            {
-                "name": "ocean",
-                "path": "/path/to/ocean.wav",
-                "duration": "60.0s",
-                "sample_rate": "48000 Hz",
-                "file_size": "1.0 MB",
-                "source_url": "https://ocean.com",
-                "description": None,  # No description
-            },
-        ]
-        mock_manager.list_sounds_with_details.return_value = mock_sounds
-
-        # Create args
-        args = Mock()
-        args.detailed = True
-
-        # Test command
-        result = list_ambient_command(args)
-
-        assert result == 0
-        mock_get_ambient_manager.assert_called_once()
-        mock_manager.list_sounds_with_details.assert_called_once()
-
-    @patch("sleepstack.commands.list_ambient.get_ambient_manager")
-    def test_list_ambient_manager_error(self, mock_get_ambient_manager):
-        """Test handling of ambient manager errors."""
-        # Mock ambient manager to raise exception
-        mock_get_ambient_manager.side_effect = Exception("Manager error")
-
-        # Create args
-        args = Mock()
-        args.detailed = False
-
-        # Test command
-        result = list_ambient_command(args)
-
-        assert result == 1
-        mock_get_ambient_manager.assert_called_once()
-
-    @patch("sleepstack.commands.list_ambient.get_ambient_manager")
-    def test_list_ambient_get_available_sounds_error(self, mock_get_ambient_manager):
-        """Test handling of get_available_sounds errors."""
-        # Mock ambient manager
-        mock_manager = Mock()
-        mock_get_ambient_manager.return_value = mock_manager
-        mock_manager.get_available_sounds.side_effect = Exception("Get sounds error")
-
-        # Create args
-        args = Mock()
-        args.detailed = False
-
-        # Test command
-        result = list_ambient_command(args)
-
-        assert result == 1
-        mock_get_ambient_manager.assert_called_once()
-        mock_manager.get_available_sounds.assert_called_once()
-
-    @patch("sleepstack.commands.list_ambient.get_ambient_manager")
-    def test_list_ambient_list_sounds_with_details_error(self, mock_get_ambient_manager):
-        """Test handling of list_sounds_with_details errors."""
-        # Mock ambient manager
-        mock_manager = Mock()
-        mock_get_ambient_manager.return_value = mock_manager
-        mock_manager.list_sounds_with_details.side_effect = Exception("List details error")
-
-        # Create args
-        args = Mock()
-        args.detailed = True
-
-        # Test command
-        result = list_ambient_command(args)
-
-        assert result == 1
-        mock_get_ambient_manager.assert_called_once()
-        mock_manager.list_sounds_with_details.assert_called_once()
-
-    @patch("sleepstack.commands.list_ambient.get_ambient_manager")
-    def test_list_ambient_single_sound_simple(self, mock_get_ambient_manager):
-        """Test listing a single sound in simple mode."""
-        # Mock ambient manager
-        mock_manager = Mock()
-        mock_get_ambient_manager.return_value = mock_manager
-        mock_manager.get_available_sounds.return_value = ["campfire"]
-
-        # Create args
-        args = Mock()
-        args.detailed = False
-
-        # Test command
-        result = list_ambient_command(args)
-
-        assert result == 0
-        mock_get_ambient_manager.assert_called_once()
-        mock_manager.get_available_sounds.assert_called_once()
-
-    @patch("sleepstack.commands.list_ambient.get_ambient_manager")
-    def test_list_ambient_single_sound_detailed(self, mock_get_ambient_manager):
-        """Test listing a single sound in detailed mode."""
-        # Mock ambient manager
-        mock_manager = Mock()
-        mock_get_ambient_manager.return_value = mock_manager
-
-        # Mock single detailed sound
-        mock_sounds = [
-            {
-                "name": "campfire",
-                "path": "/path/to/campfire.wav",
-                "duration": "60.0s",
-                "sample_rate": "48000 Hz",
-                "file_size": "1.2 MB",
-                "source_url": "https://example.com",
-                "description": "Crackling campfire sounds",
-            }
-        ]
-        mock_manager.list_sounds_with_details.return_value = mock_sounds
-
-        # Create args
-        args = Mock()
-        args.detailed = True
-
-        # Test command
-        result = list_ambient_command(args)
-
-        assert result == 0
-        mock_get_ambient_manager.assert_called_once()
-        mock_manager.list_sounds_with_details.assert_called_once()
-
-
-class TestAddListAmbientParser:
-    """Test add_list_ambient_parser function."""
-
-    def test_add_list_ambient_parser(self):
-        """Test adding the list-ambient parser."""
-        # Create mock subparsers
-        mock_subparsers = Mock()
-        mock_parser = Mock()
-        mock_subparsers.add_parser.return_value = mock_parser
-
-        # Test function
-        add_list_ambient_parser(mock_subparsers)
-
-        # Verify parser was added with correct name
-        mock_subparsers.add_parser.assert_called_once()
-        call_args = mock_subparsers.add_parser.call_args
-        assert call_args[0][0] == "list-ambient"
-
-        # Verify arguments were added
-        assert mock_parser.add_argument.call_count == 1  # --detailed
-        assert mock_parser.set_defaults.call_count == 1
-
-    def test_parser_arguments(self):
-        """Test that parser has correct arguments."""
-        import argparse
-
-        # Create real parser
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers()
-
-        # Add list-ambient parser
-        add_list_ambient_parser(subparsers)
-
-        # Test parsing without --detailed
-        args = parser.parse_args(["list-ambient"])
-        assert args.detailed is False
+    # Test function
+    add_list_ambient_parser(mock_subparsers)
 
-        # Test parsing with --detailed
-        args = parser.parse_args(["list-ambient", "--detailed"])
-        assert args.detailed is True
+    # Verify parser was added with correct name
+    mock_subparsers.add_parser.assert_called_once()
+    call_args = mock_subparsers.add_parser.call_args
+    assert call_args[0][0] == "list-ambient"
 
+    # Verify arguments were added
+    assert mock_parser.add_argument.call_count == 1  # --detailed
+    assert mock_parser.set_defaults.call_count == 1
 
-class TestIntegration:
-    """Integration tests for list_ambient command."""
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.assets_dir = Path(self.temp_dir) / "ambience"
-        self.assets_dir.mkdir(parents=True)
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
 
-    @patch("sleepstack.commands.list_ambient.get_ambient_manager")
-    def test_real_ambient_manager_integration(self, mock_get_ambient_manager):
-        """Test with real ambient manager."""
-        from sleepstack.ambient_manager import AmbientSoundManager
+def test_parser_arguments(configured_parser):
+    """Test that parser has correct arguments."""
+    # Test parsing without --detailed
+    args = configured_parser.parse_args(["list-ambient"])
+    assert args.detailed is False
 
-        # Use real ambient manager with temp directory
-        real_manager = AmbientSoundManager(self.assets_dir)
-        mock_get_ambient_manager.return_value = real_manager
+    # Test parsing with --detailed
+    args = configured_parser.parse_args(["list-ambient", "--detailed"])
+    assert args.detailed is True
 
-        # Create args
-        args = Mock()
-        args.detailed = False
 
-        # Test command
-        result = list_ambient_command(args)
+# Integration
 
-        assert result == 0
-        mock_get_ambient_manager.assert_called_once()
 
-    @patch("sleepstack.commands.list_ambient.get_ambient_manager")
-    def test_real_ambient_manager_detailed_integration(self, mock_get_ambient_manager):
-        """Test with real ambient manager in detailed mode."""
-        from sleepstack.ambient_manager import AmbientSoundManager
+def test_real_ambient_manager_integration(mocker, real_manager):
+    """Test with real ambient manager."""
+    mock_get_ambient_manager = mocker.patch("sleepstack.commands.list_ambient.get_ambient_manager")
+    mock_get_ambient_manager.return_value = real_manager
 
-        # Use real ambient manager with temp directory
-        real_manager = AmbientSoundManager(self.assets_dir)
-        mock_get_ambient_manager.return_value = real_manager
+    args = SimpleNamespace(detailed=False)
 
-        # Create args
-        args = Mock()
-        args.detailed = True
+    # Test command
+    result = list_ambient_command(args)
 
-        # Test command
-        result = list_ambient_command(args)
+    assert result == 0
+    mock_get_ambient_manager.assert_called_once()
 
-        assert result == 0
-        mock_get_ambient_manager.assert_called_once()
 
-    def test_parser_integration(self):
-        """Test parser integration with real argparse."""
-        import argparse
+def test_real_ambient_manager_detailed_integration(mocker, real_manager):
+    """Test with real ambient manager in detailed mode."""
+    mock_get_ambient_manager = mocker.patch("sleepstack.commands.list_ambient.get_ambient_manager")
+    mock_get_ambient_manager.return_value = real_manager
 
-        # Create main parser
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers()
+    args = SimpleNamespace(detailed=True)
 
-        # Add list-ambient parser
-        add_list_ambient_parser(subparsers)
+    # Test command
+    result = list_ambient_command(args)
 
-        # Test that the parser can be created and used
-        assert subparsers.choices is not None
-        assert "list-ambient" in subparsers.choices
+    assert result == 0
+    mock_get_ambient_manager.assert_called_once()
 
-    def test_command_function_assignment(self):
-        """Test that the command function is properly assigned."""
-        import argparse
 
-        # Create main parser
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers()
+def test_parser_integration(configured_parser):
+    """Test parser integration with real argparse."""
+    # Test that the subcommand is registered on the main parser
+    assert "list-ambient" in configured_parser.format_help()
 
-        # Add list-ambient parser
-        add_list_ambient_parser(subparsers)
 
-        # Parse arguments
-        args = parser.parse_args(["list-ambient"])
+def test_command_function_assignment(configured_parser):
+    """Test that the command function is properly assigned."""
+    # Parse arguments
+    args = configured_parser.parse_args(["list-ambient"])
 
-        # Check that the function is assigned
-        assert hasattr(args, "func")
-        assert args.func == list_ambient_command
+    # Check that the function is assigned
+    assert hasattr(args, "func")
+    assert args.func == list_ambient_command
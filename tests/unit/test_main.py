@@ -6,11 +6,11 @@ Tests for src/sleepstack/main.py
 import argparse
 import logging
 import os
+import struct
 import sys
-import tempfile
-import wave
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, ANY
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, ANY, create_autospec
 import pytest
 import numpy as np
 
@@ -42,40 +42,75 @@ from sleepstack.main import (
     run,
 )
 
+# Seeded noise shared by the audio tests; slice views instead of drawing per test
+_RNG = np.random.default_rng(0)
+_POOL = _RNG.standard_normal((4096, 2), dtype=np.float32)
+_POOL.setflags(write=False)
+
+# apply_fade copies before fading, so one read-only input serves every case
+_FADE_ONES = np.ones((1000, 2))
+_FADE_ONES.setflags(write=False)
+
+# Vibe names and aliases the CLI is expected to ship
+_EXPECTED_PRESET_KEYS = frozenset(
+    {"deep", "calm", "soothe", "dream", "focus", "flow", "alert", "meditate", "warm", "airy"}
+)
+_EXPECTED_ALIASES = {
+    "sleep": "deep",
+    "settle": "deep",
+    "night": "calm",
+    "study": "focus",
+    "work": "focus",
+    "creative": "flow",
+    "energize": "alert",
+    "presence": "meditate",
+    "soft": "soothe",
+    "rain": "warm",
+    "fire": "warm",
+    "bright": "airy",
+}
+
+
+def _make_wav(n, ch=2, sr=48000, offset=0):
+    """Return a read_wav-style (data, samplerate, channels) tuple viewing _POOL."""
+    return _POOL[offset : offset + n, :ch], sr, ch
+
+
+@pytest.fixture(scope="class")
+def valid_py(tmp_path_factory):
+    """Return the path of a small, importable Python module."""
+    path = tmp_path_factory.mktemp("mod") / "m.py"
+    path.write_text("test_var = 42\n")
+    return str(path)
+
+
+@pytest.fixture(scope="class")
+def invalid_py(tmp_path_factory):
+    """Return the path of a Python file containing a syntax error."""
+    path = tmp_path_factory.mktemp("mod") / "bad.py"
+    path.write_text("invalid syntax {")
+    return str(path)
+
 
 class TestModuleFromPath:
     """Test _module_from_path function."""
 
-    def test_module_from_path_success(self):
+    def test_module_from_path_success(self, valid_py):
         """Test successful module loading from path."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("test_var = 42\n")
-            temp_path = f.name
-
-        try:
-            result = _module_from_path("test_module", temp_path)
-            assert result is not None
-            assert hasattr(result, "test_var")
-            assert result.test_var == 42
-        finally:
-            os.unlink(temp_path)
+        result = _module_from_path("test_module", valid_py)
+        assert result is not None
+        assert hasattr(result, "test_var")
+        assert result.test_var == 42
 
     def test_module_from_path_nonexistent_file(self):
         """Test module loading from nonexistent file."""
         with pytest.raises(FileNotFoundError):
             _module_from_path("test_module", "/nonexistent/path.py")
 
-    def test_module_from_path_invalid_file(self):
+    def test_module_from_path_invalid_file(self, invalid_py):
         """Test module loading from invalid Python file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("invalid syntax {")
-            temp_path = f.name
-
-        try:
-            with pytest.raises(SyntaxError):
-                _module_from_path("test_module", temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(SyntaxError):
+            _module_from_path("test_module", invalid_py)
 
 
 class TestProjectRoot:
@@ -155,29 +190,17 @@ class TestPresets:
 
     def test_presets_contains_expected_keys(self):
         """Test that PRESETS contains expected vibe keys."""
-        expected_keys = {
-            "deep",
-            "calm",
-            "soothe",
-            "dream",
-            "focus",
-            "flow",
-            "alert",
-            "meditate",
-            "warm",
-            "airy",
-        }
-        assert set(PRESETS.keys()) == expected_keys
+        assert PRESETS.keys() == _EXPECTED_PRESET_KEYS
 
-    def test_presets_values_are_presets(self):
-        """Test that all PRESETS values are Preset instances."""
-        for key, preset in PRESETS.items():
-            assert isinstance(preset, Preset)
-            assert preset.beat > 0
-            assert preset.carrier > 0
-            assert preset.samplerate > 0
-            assert 0 < preset.volume <= 1
-            assert preset.fade >= 0
+    @pytest.mark.parametrize("key, preset", list(PRESETS.items()))
+    def test_preset_value_valid(self, key, preset):
+        """Test that each PRESETS value is a valid Preset instance."""
+        assert isinstance(preset, Preset)
+        assert preset.beat > 0
+        assert preset.carrier > 0
+        assert preset.samplerate > 0
+        assert 0 < preset.volume <= 1
+        assert preset.fade >= 0
 
 
 class TestAliases:
@@ -185,26 +208,12 @@ class TestAliases:
 
     def test_aliases_contains_expected_mappings(self):
         """Test that ALIASES contains expected mappings."""
-        expected_mappings = {
-            "sleep": "deep",
-            "settle": "deep",
-            "night": "calm",
-            "study": "focus",
-            "work": "focus",
-            "creative": "flow",
-            "energize": "alert",
-            "presence": "meditate",
-            "soft": "soothe",
-            "rain": "warm",
-            "fire": "warm",
-            "bright": "airy",
-        }
-        assert ALIASES == expected_mappings
+        assert ALIASES == _EXPECTED_ALIASES
 
-    def test_aliases_reference_valid_presets(self):
-        """Test that all ALIASES values reference valid PRESETS keys."""
-        for alias, preset_key in ALIASES.items():
-            assert preset_key in PRESETS
+    @pytest.mark.parametrize("alias, preset_key", list(ALIASES.items()))
+    def test_alias_references_valid_preset(self, alias, preset_key):
+        """Test that each ALIASES value references a valid PRESETS key."""
+        assert preset_key in PRESETS
 
 
 class TestResolveVibe:
@@ -260,106 +269,78 @@ class TestResolveVibe:
 class TestAudioIO:
     """Test audio I/O functions."""
 
-    def test_read_wav_success(self):
+    def test_read_wav_success(self, silent_stereo_wav):
         """Test successful WAV file reading."""
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            # Create a simple WAV file
-            with wave.open(f.name, "wb") as wf:
-                wf.setnchannels(2)
-                wf.setsampwidth(2)
-                wf.setframerate(48000)
-                # Write 1 second of silence
-                silence = b"\x00\x00" * 2 * 48000  # 2 channels, 16-bit samples
-                wf.writeframes(silence)
-
-            try:
-                data, sr, ch = read_wav(f.name)
-                assert sr == 48000
-                assert ch == 2
-                assert data.shape == (48000, 2)
-                assert np.all(data == 0.0)
-            finally:
-                os.unlink(f.name)
+        data, sr, ch = read_wav(silent_stereo_wav)
+        assert sr == 48000
+        assert ch == 2
+        assert data.shape == (48000, 2)
+        assert not data.any()
 
+    @pytest.mark.usefixtures("no_sleep")
     def test_read_wav_nonexistent_file(self):
         """Test reading nonexistent WAV file."""
         with pytest.raises(FileNotFoundError):
             read_wav("/nonexistent/file.wav")
 
-    def test_read_wav_empty_file(self):
+    @pytest.mark.usefixtures("no_sleep")
+    def test_read_wav_empty_file(self, tmp_path):
         """Test reading empty WAV file."""
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            # Create empty file
-            pass
-
-        try:
-            with pytest.raises(ValueError) as exc_info:
-                read_wav(f.name)
-            assert "File is empty" in str(exc_info.value)
-        finally:
-            os.unlink(f.name)
-
-    def test_read_wav_invalid_bit_depth(self):
+        empty_path = tmp_path / "empty.wav"
+        empty_path.touch()
+
+        with pytest.raises(ValueError) as exc_info:
+            read_wav(str(empty_path))
+        assert "File is empty" in str(exc_info.value)
+
+    def test_read_wav_invalid_bit_depth(self, bit8_wav):
         """Test reading WAV file with invalid bit depth."""
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            # Create WAV file with 8-bit samples (invalid)
-            with wave.open(f.name, "wb") as wf:
-                wf.setnchannels(2)
-                wf.setsampwidth(1)  # 8-bit
-                wf.setframerate(48000)
-                silence = b"\x00" * 2 * 48000
-                wf.writeframes(silence)
-
-            try:
-                with pytest.raises(SystemExit) as exc_info:
-                    read_wav(f.name)
-                assert "only 16-bit PCM supported" in str(exc_info.value)
-            finally:
-                os.unlink(f.name)
-
-    def test_write_wav_success(self):
-        """Test successful WAV file writing."""
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            # Create test data
-            data = np.random.randn(1000, 2).astype(np.float32)
-            sr = 48000
+        with pytest.raises(SystemExit) as exc_info:
+            read_wav(bit8_wav)
+        assert "only 16-bit PCM supported" in str(exc_info.value)
 
-            write_wav(f.name, data, sr)
+    def test_write_wav_success(self, tmp_path):
+        """Test successful WAV file writing."""
+        output_path = str(tmp_path / "out.wav")
+        # Create test data
+        data = np.zeros((1000, 2), dtype=np.float32)
+        sr = 48000
 
-            # Verify the file was created and has correct properties
-            assert os.path.exists(f.name)
-            with wave.open(f.name, "rb") as wf:
-                assert wf.getframerate() == sr
-                assert wf.getnchannels() == 2
-                assert wf.getsampwidth() == 2  # 16-bit
+        write_wav(output_path, data, sr)
 
-            os.unlink(f.name)
+        # Verify the file was created and has correct properties
+        assert os.path.exists(output_path)
+        with open(output_path, "rb") as fh:
+            header = fh.read(44)
+        # Canonical RIFF header: channels, rate, byte rate, block align, bits per sample
+        nchannels, framerate, _, _, bits = struct.unpack_from("<HIIHH", header, 22)
+        assert framerate == sr
+        assert nchannels == 2
+        assert bits == 16
 
-    def test_write_wav_clipping(self):
+    def test_write_wav_clipping(self, tmp_path):
         """Test WAV writing with clipping."""
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            # Create data that exceeds [-1, 1] range
-            data = np.array([[2.0, -2.0], [1.5, -1.5]], dtype=np.float32)
-            sr = 48000
+        output_path = str(tmp_path / "clipped.wav")
+        # Create data that exceeds [-1, 1] range
+        data = np.array([[2.0, -2.0], [1.5, -1.5]], dtype=np.float32)
+        sr = 48000
 
-            write_wav(f.name, data, sr)
+        write_wav(output_path, data, sr)
 
-            # Verify the file was created
-            assert os.path.exists(f.name)
-            os.unlink(f.name)
+        # Verify the file was created
+        assert os.path.exists(output_path)
 
-    def test_write_wav_creates_directory(self):
+    def test_write_wav_creates_directory(self, tmp_path):
         """Test WAV writing creates parent directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = os.path.join(temp_dir, "subdir", "test.wav")
-            data = np.random.randn(100, 2).astype(np.float32)
-            sr = 48000
+        output_path = str(tmp_path / "subdir" / "test.wav")
+        data = np.zeros((100, 2), dtype=np.float32)
+        sr = 48000
 
-            write_wav(output_path, data, sr)
+        write_wav(output_path, data, sr)
 
-            # Verify the file and directory were created
-            assert os.path.exists(output_path)
-            assert os.path.exists(os.path.dirname(output_path))
+        # Verify the file and directory were created
+        assert os.path.exists(output_path)
+        assert os.path.exists(os.path.dirname(output_path))
 
 
 class TestUtilityAudioFunctions:
@@ -367,66 +348,40 @@ class TestUtilityAudioFunctions:
 
     def test_ensure_stereo_stereo_input(self):
         """Test ensure_stereo with stereo input."""
-        data = np.random.randn(100, 2)
+        data = _POOL[:100]
         result = ensure_stereo(data)
         assert np.array_equal(result, data)
 
     def test_ensure_stereo_mono_input(self):
         """Test ensure_stereo with mono input."""
-        data = np.random.randn(100, 1)
+        data = _POOL[:100, :1]
         result = ensure_stereo(data)
         assert result.shape == (100, 2)
-        assert np.array_equal(result[:, 0], data[:, 0])
-        assert np.array_equal(result[:, 1], data[:, 0])
+        assert np.array_equal(result, np.broadcast_to(data, (100, 2)))
 
     def test_db_to_gain(self):
         """Test dB to gain conversion."""
-        assert abs(db_to_gain(0) - 1.0) < 1e-6
-        assert abs(db_to_gain(-6) - 0.5011872336272722) < 1e-6
-        assert abs(db_to_gain(-20) - 0.1) < 1e-6
-        assert abs(db_to_gain(-40) - 0.01) < 1e-6
-
-    def test_apply_fade_no_fade(self):
-        """Test apply_fade with no fade."""
-        data = np.random.randn(1000, 2)
-        result = apply_fade(data, 48000, 0.0)
-        assert np.array_equal(result, data)
-
-    def test_apply_fade_negative_fade(self):
-        """Test apply_fade with negative fade."""
-        data = np.random.randn(1000, 2)
-        result = apply_fade(data, 48000, -1.0)
-        assert np.array_equal(result, data)
-
-    def test_apply_fade_normal_fade(self):
-        """Test apply_fade with normal fade."""
-        data = np.ones((1000, 2))
-        sr = 48000
-        fade_sec = 0.1  # 100ms fade
-        result = apply_fade(data, sr, fade_sec)
-
-        # Check that fade is applied
-        fade_samples = int(fade_sec * sr)
-        assert fade_samples > 0
-
-        # First samples should be faded in
-        assert result[0, 0] < 1.0
-        assert result[0, 1] < 1.0
-
-        # Last samples should be faded out
-        assert result[-1, 0] < 1.0
-        assert result[-1, 1] < 1.0
-
-    def test_apply_fade_too_long(self):
-        """Test apply_fade with fade longer than half signal."""
-        data = np.ones((100, 2))
-        sr = 48000
-        fade_sec = 10.0  # Very long fade
-        result = apply_fade(data, sr, fade_sec)
-
-        # Should still apply fade but limited to half the signal
-        assert result[0, 0] < 1.0
-        assert result[-1, 0] < 1.0
+        db = [0, -6, -20, -40]
+        expected = [1.0, 0.5011872336272722, 0.1, 0.01]
+        np.testing.assert_allclose([db_to_gain(x) for x in db], expected, rtol=0, atol=1e-6)
+
+    @pytest.mark.parametrize(
+        "fade_sec, expect_identity",
+        [
+            pytest.param(0.0, True, id="no_fade"),
+            pytest.param(-1.0, True, id="negative_fade"),
+            pytest.param(0.1, False, id="normal_fade"),
+            pytest.param(10.0, False, id="too_long"),  # limited to half the signal
+        ],
+    )
+    def test_apply_fade(self, fade_sec, expect_identity):
+        """Test apply_fade leaves the signal alone or fades both ends."""
+        result = apply_fade(_FADE_ONES, 48000, fade_sec)
+        if expect_identity:
+            assert np.array_equal(result, _FADE_ONES)
+        else:
+            assert np.all(result[0] < 1.0)
+            assert np.all(result[-1] < 1.0)
 
 
 class TestGenerateBinauralWav:
@@ -452,8 +407,7 @@ class TestMixMultipleAmbientSounds:
     def test_mix_multiple_ambient_sounds_success(self, mock_read_wav):
         """Test successful mixing of multiple ambient sounds."""
         # Mock read_wav to return test data
-        test_data = np.random.randn(1000, 2)
-        mock_read_wav.return_value = (test_data, 48000, 2)
+        mock_read_wav.return_value = _make_wav(1000)
 
         ambient_paths = ["/path/to/sound1.wav", "/path/to/sound2.wav"]
         target_samples = 1000
@@ -479,8 +433,7 @@ class TestMixMultipleAmbientSounds:
     def test_mix_multiple_ambient_sounds_short_audio(self, mock_read_wav):
         """Test mixing with audio shorter than target."""
         # Create short audio data
-        short_data = np.random.randn(500, 2)
-        mock_read_wav.return_value = (short_data, 48000, 2)
+        mock_read_wav.return_value = _make_wav(500)
 
         ambient_paths = ["/path/to/short.wav"]
         target_samples = 1000
@@ -495,8 +448,7 @@ class TestMixMultipleAmbientSounds:
     def test_mix_multiple_ambient_sounds_long_audio(self, mock_read_wav):
         """Test mixing with audio longer than target."""
         # Create long audio data
-        long_data = np.random.randn(2000, 2)
-        mock_read_wav.return_value = (long_data, 48000, 2)
+        mock_read_wav.return_value = _make_wav(2000)
 
         ambient_paths = ["/path/to/long.wav"]
         target_samples = 1000
@@ -511,8 +463,7 @@ class TestMixMultipleAmbientSounds:
     def test_mix_multiple_ambient_sounds_mono_input(self, mock_read_wav):
         """Test mixing with mono input audio."""
         # Create mono audio data
-        mono_data = np.random.randn(1000, 1)
-        mock_read_wav.return_value = (mono_data, 48000, 1)
+        mock_read_wav.return_value = _make_wav(1000, ch=1)
 
         ambient_paths = ["/path/to/mono.wav"]
         target_samples = 1000
@@ -527,7 +478,8 @@ class TestMixMultipleAmbientSounds:
     def test_mix_multiple_ambient_sounds_peak_limiting(self, mock_read_wav):
         """Test mixing with peak limiting."""
         # Create audio data that would exceed 0.999 when mixed
-        loud_data = np.ones((1000, 2)) * 0.8  # Each sound at 0.8, mixed would be 1.6
+        # Each sound at 0.8, mixed would be 1.6
+        loud_data = np.full((1000, 2), 0.8, dtype=np.float32)
         mock_read_wav.return_value = (loud_data, 48000, 2)
 
         ambient_paths = ["/path/to/loud1.wav", "/path/to/loud2.wav"]
@@ -547,17 +499,14 @@ class TestMixBinauralAndMultipleAmbience:
     @patch("sleepstack.main.write_wav")
     @patch("sleepstack.main.mix_multiple_ambient_sounds")
     @patch("sleepstack.main.project_root")
-    @patch("pathlib.Path.mkdir")
     def test_mix_binaural_and_multiple_ambience_success(
-        self, mock_mkdir, mock_root, mock_mix_ambient, mock_write_wav, mock_read_wav
+        self, mock_root, mock_mix_ambient, mock_write_wav, mock_read_wav, tmp_path
     ):
         """Test successful mixing of binaural with multiple ambient sounds."""
         # Setup mocks
-        mock_root.return_value = Path("/project")
-        mock_mkdir.return_value = None
-        binaural_data = np.random.randn(1000, 2)
-        mock_read_wav.return_value = (binaural_data, 48000, 2)
-        mixed_ambient = np.random.randn(1000, 2)
+        mock_root.return_value = tmp_path
+        mock_read_wav.return_value = _make_wav(1000)
+        mixed_ambient = _POOL[1000:2000]
         mock_mix_ambient.return_value = mixed_ambient
 
         binaural_path = "/path/to/binaural.wav"
@@ -577,8 +526,7 @@ class TestMixBinauralAndMultipleAmbience:
     def test_mix_binaural_and_multiple_ambience_mono_binaural(self, mock_read_wav):
         """Test mixing with mono binaural input."""
         # Create mono binaural data
-        mono_data = np.random.randn(1000, 1)
-        mock_read_wav.return_value = (mono_data, 48000, 1)
+        mock_read_wav.return_value = _make_wav(1000, ch=1)
 
         binaural_path = "/path/to/mono_binaural.wav"
         ambient_paths = ["/path/to/ambient.wav"]
@@ -594,9 +542,8 @@ class TestMixBinauralAndMultipleAmbience:
         self, mock_mix_ambient, mock_write_wav, mock_read_wav
     ):
         """Test mixing with custom output path."""
-        binaural_data = np.random.randn(1000, 2)
-        mock_read_wav.return_value = (binaural_data, 48000, 2)
-        mixed_ambient = np.random.randn(1000, 2)
+        mock_read_wav.return_value = _make_wav(1000)
+        mixed_ambient = _POOL[1000:2000]
         mock_mix_ambient.return_value = mixed_ambient
 
         binaural_path = "/path/to/binaural.wav"
@@ -617,17 +564,13 @@ class TestMixBinauralAndAmbience:
     @patch("sleepstack.main.read_wav")
     @patch("sleepstack.main.write_wav")
     @patch("sleepstack.main.project_root")
-    @patch("pathlib.Path.mkdir")
     def test_mix_binaural_and_ambience_success(
-        self, mock_mkdir, mock_root, mock_write_wav, mock_read_wav
+        self, mock_root, mock_write_wav, mock_read_wav, tmp_path
     ):
         """Test successful mixing of binaural with single ambient sound."""
         # Setup mocks
-        mock_root.return_value = Path("/project")
-        mock_mkdir.return_value = None
-        binaural_data = np.random.randn(1000, 2)
-        ambient_data = np.random.randn(1000, 2)
-        mock_read_wav.side_effect = [(binaural_data, 48000, 2), (ambient_data, 48000, 2)]
+        mock_root.return_value = tmp_path
+        mock_read_wav.side_effect = [_make_wav(1000), _make_wav(1000, offset=1000)]
 
         binaural_path = "/path/to/binaural.wav"
         ambience_path = "/path/to/ambient.wav"
@@ -645,8 +588,7 @@ class TestMixBinauralAndAmbience:
     def test_mix_binaural_and_ambience_mono_binaural(self, mock_read_wav):
         """Test mixing with mono binaural input."""
         # Create mono binaural data
-        mono_data = np.random.randn(1000, 1)
-        mock_read_wav.return_value = (mono_data, 48000, 1)
+        mock_read_wav.return_value = _make_wav(1000, ch=1)
 
         binaural_path = "/path/to/mono_binaural.wav"
         ambience_path = "/path/to/ambient.wav"
@@ -658,9 +600,7 @@ class TestMixBinauralAndAmbience:
     @patch("sleepstack.main.read_wav")
     def test_mix_binaural_and_ambience_samplerate_mismatch(self, mock_read_wav):
         """Test mixing with samplerate mismatch."""
-        binaural_data = np.random.randn(1000, 2)
-        ambient_data = np.random.randn(1000, 2)
-        mock_read_wav.side_effect = [(binaural_data, 48000, 2), (ambient_data, 44100, 2)]
+        mock_read_wav.side_effect = [_make_wav(1000), _make_wav(1000, sr=44100, offset=1000)]
 
         binaural_path = "/path/to/binaural.wav"
         ambience_path = "/path/to/ambient.wav"
@@ -673,9 +613,7 @@ class TestMixBinauralAndAmbience:
     @patch("sleepstack.main.write_wav")
     def test_mix_binaural_and_ambience_custom_output(self, mock_write_wav, mock_read_wav):
         """Test mixing with custom output path."""
-        binaural_data = np.random.randn(1000, 2)
-        ambient_data = np.random.randn(1000, 2)
-        mock_read_wav.side_effect = [(binaural_data, 48000, 2), (ambient_data, 48000, 2)]
+        mock_read_wav.side_effect = [_make_wav(1000), _make_wav(1000, offset=1000)]
 
         binaural_path = "/path/to/binaural.wav"
         ambience_path = "/path/to/ambient.wav"
@@ -696,176 +634,117 @@ class TestValidationFunctions:
         assert positive_float_minutes("5.5") == 5.5
         assert positive_float_minutes("10.0") == 10.0
 
-    def test_positive_float_minutes_invalid(self):
-        """Test positive_float_minutes with invalid values."""
-        with pytest.raises(argparse.ArgumentTypeError) as exc_info:
-            positive_float_minutes("0")
-        assert "must be > 0" in str(exc_info.value)
-
-        with pytest.raises(argparse.ArgumentTypeError) as exc_info:
-            positive_float_minutes("-1")
-        assert "must be > 0" in str(exc_info.value)
-
-        with pytest.raises(argparse.ArgumentTypeError) as exc_info:
-            positive_float_minutes("11")
-        assert "must be <= 10 minutes" in str(exc_info.value)
-
     def test_positive_float_seconds_valid(self):
         """Test positive_float_seconds with valid values."""
         assert positive_float_seconds("60.0") == 60.0
         assert positive_float_seconds("300.5") == 300.5
         assert positive_float_seconds("600.0") == 600.0
 
-    def test_positive_float_seconds_invalid(self):
-        """Test positive_float_seconds with invalid values."""
-        with pytest.raises(argparse.ArgumentTypeError) as exc_info:
-            positive_float_seconds("0")
-        assert "must be > 0" in str(exc_info.value)
-
-        with pytest.raises(argparse.ArgumentTypeError) as exc_info:
-            positive_float_seconds("-1")
-        assert "must be > 0" in str(exc_info.value)
-
-        with pytest.raises(argparse.ArgumentTypeError) as exc_info:
-            positive_float_seconds("601")
-        assert "must be <= 600 seconds" in str(exc_info.value)
-
     def test_nonneg_float_valid(self):
         """Test nonneg_float with valid values."""
         assert nonneg_float("0.0") == 0.0
         assert nonneg_float("1.5") == 1.5
         assert nonneg_float("10.0") == 10.0
 
-    def test_nonneg_float_invalid(self):
-        """Test nonneg_float with invalid values."""
-        with pytest.raises(argparse.ArgumentTypeError) as exc_info:
-            nonneg_float("-1")
-        assert "must be >= 0" in str(exc_info.value)
-
-        with pytest.raises(argparse.ArgumentTypeError) as exc_info:
-            nonneg_float("-0.1")
-        assert "must be >= 0" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        "func, bad, msg",
+        [
+            (positive_float_minutes, "0", "must be > 0"),
+            (positive_float_minutes, "-1", "must be > 0"),
+            (positive_float_minutes, "11", "must be <= 10 minutes"),
+            (positive_float_seconds, "0", "must be > 0"),
+            (positive_float_seconds, "-1", "must be > 0"),
+            (positive_float_seconds, "601", "must be <= 600 seconds"),
+            (nonneg_float, "-1", "must be >= 0"),
+            (nonneg_float, "-0.1", "must be >= 0"),
+        ],
+    )
+    def test_validator_rejects(self, func, bad, msg):
+        """Test the argparse validators reject out-of-range values."""
+        with pytest.raises(argparse.ArgumentTypeError, match=msg):
+            func(bad)
+
+
+# Path objects are immutable, so every main() test can share one
+_FAKE_AMBIENT_PATH = Path("/path/to/campfire.wav")
+
+
+@pytest.fixture
+def main_mocks(monkeypatch):
+    """Replace main()'s collaborators with autospecced mocks preset for a successful run."""
+    import sleepstack.main as m
+
+    mocks = SimpleNamespace(
+        resolve_vibe=create_autospec(m.resolve_vibe, return_value="calm"),
+        generate_binaural_wav=create_autospec(
+            m.generate_binaural_wav, return_value=("/path/to/binaural.wav", 48000)
+        ),
+        get_available_ambient_sounds=create_autospec(
+            m.get_available_ambient_sounds, return_value=["campfire", "rain"]
+        ),
+        validate_ambient_sound=create_autospec(m.validate_ambient_sound, return_value=True),
+        get_ambient_sound_path=create_autospec(
+            m.get_ambient_sound_path, return_value=_FAKE_AMBIENT_PATH
+        ),
+        mix_binaural_and_ambience=create_autospec(
+            m.mix_binaural_and_ambience, return_value="/path/to/output.wav"
+        ),
+        mix_binaural_and_multiple_ambience=create_autospec(
+            m.mix_binaural_and_multiple_ambience, return_value="/path/to/output.wav"
+        ),
+    )
+    for name, mock in vars(mocks).items():
+        monkeypatch.setattr(m, name, mock)
+    return mocks
 
 
 class TestMain:
     """Test main function."""
 
-    @patch("sleepstack.main.resolve_vibe")
-    @patch("sleepstack.main.generate_binaural_wav")
-    @patch("sleepstack.main.get_available_ambient_sounds")
-    @patch("sleepstack.main.validate_ambient_sound")
-    @patch("sleepstack.main.get_ambient_sound_path")
-    @patch("sleepstack.main.mix_binaural_and_ambience")
-    @patch("sleepstack.main.mix_binaural_and_multiple_ambience")
-    def test_main_single_ambient_success(
-        self,
-        mock_mix_multiple,
-        mock_mix_single,
-        mock_get_path,
-        mock_validate,
-        mock_get_available,
-        mock_generate,
-        mock_resolve,
-    ):
+    def test_main_single_ambient_success(self, main_mocks):
         """Test main function with single ambient sound."""
-        # Setup mocks
-        mock_resolve.return_value = "calm"
-        mock_generate.return_value = ("/path/to/binaural.wav", 48000)
-        mock_get_available.return_value = ["campfire", "rain"]
-        mock_validate.return_value = True
-        mock_get_path.return_value = Path("/path/to/campfire.wav")
-        mock_mix_single.return_value = "/path/to/output.wav"
-
         argv = ["--vibe", "calm", "--minutes", "5", "--ambient", "campfire"]
         result = main(argv)
 
         assert result == 0
-        mock_resolve.assert_called_once_with("calm")
-        mock_generate.assert_called_once()
-        mock_validate.assert_called_once_with("campfire")
-        mock_get_path.assert_called_once_with("campfire")
-        mock_mix_single.assert_called_once()
-        mock_mix_multiple.assert_not_called()
-
-    @patch("sleepstack.main.resolve_vibe")
-    @patch("sleepstack.main.generate_binaural_wav")
-    @patch("sleepstack.main.get_available_ambient_sounds")
-    @patch("sleepstack.main.validate_ambient_sound")
-    @patch("sleepstack.main.get_ambient_sound_path")
-    @patch("sleepstack.main.mix_binaural_and_ambience")
-    @patch("sleepstack.main.mix_binaural_and_multiple_ambience")
-    def test_main_multiple_ambient_success(
-        self,
-        mock_mix_multiple,
-        mock_mix_single,
-        mock_get_path,
-        mock_validate,
-        mock_get_available,
-        mock_generate,
-        mock_resolve,
-    ):
+        main_mocks.resolve_vibe.assert_called_once_with("calm")
+        main_mocks.generate_binaural_wav.assert_called_once()
+        main_mocks.validate_ambient_sound.assert_called_once_with("campfire")
+        main_mocks.get_ambient_sound_path.assert_called_once_with("campfire")
+        main_mocks.mix_binaural_and_ambience.assert_called_once()
+        main_mocks.mix_binaural_and_multiple_ambience.assert_not_called()
+
+    def test_main_multiple_ambient_success(self, main_mocks):
         """Test main function with multiple ambient sounds."""
-        # Setup mocks
-        mock_resolve.return_value = "calm"
-        mock_generate.return_value = ("/path/to/binaural.wav", 48000)
-        mock_get_available.return_value = ["campfire", "rain"]
-        mock_validate.return_value = True
-        mock_get_path.return_value = Path("/path/to/ambient.wav")
-        mock_mix_multiple.return_value = "/path/to/output.wav"
-
         argv = ["--vibe", "calm", "--minutes", "5", "--ambient", "campfire,rain"]
         result = main(argv)
 
         assert result == 0
-        mock_resolve.assert_called_once_with("calm")
-        mock_generate.assert_called_once()
-        assert mock_validate.call_count == 2  # Called for each ambient sound
-        assert mock_get_path.call_count == 2  # Called for each ambient sound
-        mock_mix_multiple.assert_called_once()
-        mock_mix_single.assert_not_called()
-
-    @patch("sleepstack.main.resolve_vibe")
-    @patch("sleepstack.main.generate_binaural_wav")
-    @patch("sleepstack.main.mix_binaural_and_ambience")
-    def test_main_ambience_file_success(self, mock_mix, mock_generate, mock_resolve):
+        main_mocks.resolve_vibe.assert_called_once_with("calm")
+        main_mocks.generate_binaural_wav.assert_called_once()
+        # Called for each ambient sound
+        assert main_mocks.validate_ambient_sound.call_count == 2
+        assert main_mocks.get_ambient_sound_path.call_count == 2
+        main_mocks.mix_binaural_and_multiple_ambience.assert_called_once()
+        main_mocks.mix_binaural_and_ambience.assert_not_called()
+
+    def test_main_ambience_file_success(self, main_mocks, tmp_path):
         """Test main function with ambience file."""
-        # Setup mocks
-        mock_resolve.return_value = "calm"
-        mock_generate.return_value = ("/path/to/binaural.wav", 48000)
-        mock_mix.return_value = "/path/to/output.wav"
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            # Create a dummy WAV file
-            with wave.open(f.name, "wb") as wf:
-                wf.setnchannels(2)
-                wf.setsampwidth(2)
-                wf.setframerate(48000)
-                wf.writeframes(b"\x00\x00" * 2 * 1000)
-
-            try:
-                argv = ["--vibe", "calm", "--minutes", "5", "--ambience-file", f.name]
-                result = main(argv)
-
-                assert result == 0
-                mock_resolve.assert_called_once_with("calm")
-                mock_generate.assert_called_once()
-                mock_mix.assert_called_once()
-            finally:
-                os.unlink(f.name)
-
-    @patch("sleepstack.main.resolve_vibe")
-    @patch("sleepstack.main.generate_binaural_wav")
-    @patch("sleepstack.main.get_available_ambient_sounds")
-    @patch("sleepstack.main.validate_ambient_sound")
-    def test_main_invalid_ambient_sound(
-        self, mock_validate, mock_get_available, mock_generate, mock_resolve
-    ):
+        # The mixer is mocked, so main() only needs the path to exist
+        ambience = tmp_path / "amb.wav"
+        ambience.touch()
+
+        argv = ["--vibe", "calm", "--minutes", "5", "--ambience-file", str(ambience)]
+        result = main(argv)
+
+        assert result == 0
+        main_mocks.resolve_vibe.assert_called_once_with("calm")
+        main_mocks.generate_binaural_wav.assert_called_once()
+        main_mocks.mix_binaural_and_ambience.assert_called_once()
+
+    def test_main_invalid_ambient_sound(self, main_mocks):
         """Test main function with invalid ambient sound."""
-        # Setup mocks
-        mock_resolve.return_value = "calm"
-        mock_generate.return_value = ("/path/to/binaural.wav", 48000)
-        mock_get_available.return_value = ["campfire", "rain"]
-        mock_validate.return_value = False
+        main_mocks.validate_ambient_sound.return_value = False
 
         argv = ["--vibe", "calm", "--minutes", "5", "--ambient", "invalid"]
 
@@ -873,21 +752,9 @@ class TestMain:
             main(argv)
         assert "Unknown ambient sound 'invalid'" in str(exc_info.value)
 
-    @patch("sleepstack.main.resolve_vibe")
-    @patch("sleepstack.main.generate_binaural_wav")
-    @patch("sleepstack.main.get_available_ambient_sounds")
-    @patch("sleepstack.main.validate_ambient_sound")
-    @patch("sleepstack.main.get_ambient_sound_path")
-    def test_main_ambient_sound_file_not_found(
-        self, mock_get_path, mock_validate, mock_get_available, mock_generate, mock_resolve
-    ):
+    def test_main_ambient_sound_file_not_found(self, main_mocks):
         """Test main function when ambient sound file is not found."""
-        # Setup mocks
-        mock_resolve.return_value = "calm"
-        mock_generate.return_value = ("/path/to/binaural.wav", 48000)
-        mock_get_available.return_value = ["campfire", "rain"]
-        mock_validate.return_value = True
-        mock_get_path.return_value = None  # File not found
+        main_mocks.get_ambient_sound_path.return_value = None  # File not found
 
         argv = ["--vibe", "calm", "--minutes", "5", "--ambient", "campfire"]
 
@@ -895,44 +762,16 @@ class TestMain:
             main(argv)
         assert "Ambient sound file not found: campfire" in str(exc_info.value)
 
-    @patch("sleepstack.main.resolve_vibe")
-    @patch("sleepstack.main.generate_binaural_wav")
-    def test_main_ambience_file_not_found(self, mock_generate, mock_resolve):
+    def test_main_ambience_file_not_found(self, main_mocks):
         """Test main function when ambience file is not found."""
-        # Setup mocks
-        mock_resolve.return_value = "calm"
-        mock_generate.return_value = ("/path/to/binaural.wav", 48000)
-
         argv = ["--vibe", "calm", "--minutes", "5", "--ambience-file", "/nonexistent/file.wav"]
 
         with pytest.raises(SystemExit) as exc_info:
             main(argv)
         assert "Ambience file not found: /nonexistent/file.wav" in str(exc_info.value)
 
-    @patch("sleepstack.main.resolve_vibe")
-    @patch("sleepstack.main.generate_binaural_wav")
-    @patch("sleepstack.main.get_available_ambient_sounds")
-    @patch("sleepstack.main.validate_ambient_sound")
-    @patch("sleepstack.main.get_ambient_sound_path")
-    @patch("sleepstack.main.mix_binaural_and_ambience")
-    def test_main_with_overrides(
-        self,
-        mock_mix,
-        mock_get_path,
-        mock_validate,
-        mock_get_available,
-        mock_generate,
-        mock_resolve,
-    ):
+    def test_main_with_overrides(self, main_mocks):
         """Test main function with parameter overrides."""
-        # Setup mocks
-        mock_resolve.return_value = "calm"
-        mock_generate.return_value = ("/path/to/binaural.wav", 48000)
-        mock_get_available.return_value = ["campfire"]
-        mock_validate.return_value = True
-        mock_get_path.return_value = Path("/path/to/campfire.wav")
-        mock_mix.return_value = "/path/to/output.wav"
-
         argv = [
             "--vibe",
             "calm",
@@ -964,51 +803,29 @@ class TestMain:
         assert result == 0
 
         # Verify generate_binaural_wav was called with overrides
-        call_args = mock_generate.call_args
-        assert call_args[1]["beat"] == 8.0
-        assert call_args[1]["carrier"] == 220.0
-        assert call_args[1]["samplerate"] == 44100
-        assert call_args[1]["volume"] == 0.3
-        assert call_args[1]["fade"] == 1.5
+        expected = {"beat": 8.0, "carrier": 220.0, "samplerate": 44100, "volume": 0.3, "fade": 1.5}
+        kwargs = main_mocks.generate_binaural_wav.call_args.kwargs
+        assert {k: kwargs[k] for k in expected} == expected
 
         # Verify mix_binaural_and_ambience was called with overrides
-        call_args = mock_mix.call_args
-        assert call_args[1]["binaural_db"] == -12.0
-        assert call_args[1]["ambience_db"] == -18.0
-        assert call_args[1]["ambience_fade"] == 3.0
-        assert call_args[1]["out_path"] == "/custom/output.wav"
-
-    @patch("sleepstack.main.resolve_vibe")
-    @patch("sleepstack.main.generate_binaural_wav")
-    @patch("sleepstack.main.get_available_ambient_sounds")
-    @patch("sleepstack.main.validate_ambient_sound")
-    @patch("sleepstack.main.get_ambient_sound_path")
-    @patch("sleepstack.main.mix_binaural_and_ambience")
-    def test_main_with_loop_flag(
-        self,
-        mock_mix,
-        mock_get_path,
-        mock_validate,
-        mock_get_available,
-        mock_generate,
-        mock_resolve,
-    ):
-        """Test main function with loop flag."""
-        # Setup mocks
-        mock_resolve.return_value = "calm"
-        mock_generate.return_value = ("/path/to/binaural.wav", 48000)
-        mock_get_available.return_value = ["campfire"]
-        mock_validate.return_value = True
-        mock_get_path.return_value = Path("/path/to/campfire.wav")
-        mock_mix.return_value = "/path/to/output.wav"
+        expected = {
+            "binaural_db": -12.0,
+            "ambience_db": -18.0,
+            "ambience_fade": 3.0,
+            "out_path": "/custom/output.wav",
+        }
+        kwargs = main_mocks.mix_binaural_and_ambience.call_args.kwargs
+        assert {k: kwargs[k] for k in expected} == expected
 
+    def test_main_with_loop_flag(self, main_mocks):
+        """Test main function with loop flag."""
         argv = ["--vibe", "calm", "--minutes", "5", "--ambient", "campfire", "--loop"]
         result = main(argv)
 
         assert result == 0
 
         # Verify generate_binaural_wav was called with loop=True
-        call_args = mock_generate.call_args
+        call_args = main_mocks.generate_binaural_wav.call_args
         assert call_args[1]["loop"] is True
 
     def test_main_missing_required_args(self):
@@ -1030,23 +847,17 @@ class TestMain:
 class TestRun:
     """Test run function."""
 
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            pytest.param(["--vibe", "calm", "--minutes", "5", "--ambient", "campfire"], id="argv"),
+            pytest.param(None, id="none"),
+        ],
+    )
     @patch("sleepstack.main.main")
-    def test_run_calls_main(self, mock_main):
-        """Test that run function calls main."""
+    def test_run_delegates_to_main(self, mock_main, argv):
+        """Test that run passes argv straight through to main."""
         mock_main.return_value = 0
-        argv = ["--vibe", "calm", "--minutes", "5", "--ambient", "campfire"]
 
-        result = run(argv)
-
-        assert result == 0
+        assert run(argv) == 0
         mock_main.assert_called_once_with(argv)
-
-    @patch("sleepstack.main.main")
-    def test_run_with_none_argv(self, mock_main):
-        """Test run function with None argv."""
-        mock_main.return_value = 0
-
-        result = run(None)
-
-        assert result == 0
-        mock_main.assert_called_once_with(None)
@@ -1,11 +1,11 @@
 """Tests for remove_ambient.py"""
 
 import pytest
-import tempfile
+import shutil
 import json
 import wave
 from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import Mock, patch
 
 from sleepstack.commands.remove_ambient import (
     remove_ambient_command,
@@ -14,50 +14,85 @@ from sleepstack.commands.remove_ambient import (
 from sleepstack.ambient_manager import AmbientSoundError, AmbientSoundMetadata
 
 
-class TestRemoveAmbientCommand:
-    """Test remove_ambient_command function."""
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.assets_dir = Path(self.temp_dir) / "ambience"
-        self.assets_dir.mkdir(parents=True)
+def _metadata(path, **overrides):
+    """Build AmbientSoundMetadata for "test_sound" at ``path``, overriding any field."""
+    defaults = dict(
+        name="test_sound",
+        path=path,
+        duration_seconds=60.0,
+        sample_rate=48000,
+        channels=2,
+        file_size_bytes=1000000,
+        created_date="2024-01-01T00:00:00Z",
+        source_url="https://example.com",
+        description="Test sound",
+    )
+    defaults.update(overrides)
+    return AmbientSoundMetadata(**defaults)
+
+
+@pytest.fixture(scope="module")
+def prepared_ambient_sound(tmp_path_factory):
+    """Build a real ambient sound tree once; tests copy it before removing it."""
+    assets_dir = tmp_path_factory.mktemp("prepared") / "ambience"
+    sound_name = "test_sound"
+    sound_dir = assets_dir / sound_name
+    sound_dir.mkdir(parents=True)
+
+    # Create WAV file
+    wav_path = sound_dir / f"{sound_name}_1m.wav"
+    with wave.open(str(wav_path), "wb") as wf:
+        wf.setnchannels(2)
+        wf.setsampwidth(2)
+        wf.setframerate(48000)
+        wf.writeframes(b"\x00" * 4)  # one stereo frame; only the files need to exist
+
+    # Create metadata
+    metadata_path = sound_dir / f"{sound_name}_metadata.json"
+    metadata = {
+        "name": sound_name,
+        "path": str(wav_path),
+        "duration_seconds": 60.0,
+        "sample_rate": 48000,
+        "channels": 2,
+        "file_size_bytes": wav_path.stat().st_size,
+        "created_date": "2024-01-01T00:00:00Z",
+        "last_modified": "2024-01-01T00:00:00Z",
+        "source_url": "https://example.com",
+        "description": "Test sound",
+    }
+
+    with open(metadata_path, "w") as f:
+        json.dump(metadata, f)
+
+    return assets_dir, sound_name, wav_path, metadata_path
+
+
+@pytest.fixture
+def fresh_sound(prepared_ambient_sound, tmp_path):
+    """Copy the prepared sound tree into this test's tmp_path and return its paths."""
+    src_assets_dir, sound_name, src_wav_path, src_metadata_path = prepared_ambient_sound
+    assets_dir = tmp_path / "ambience"
+    shutil.copytree(src_assets_dir, assets_dir)
+    sound_dir = assets_dir / sound_name
+    return assets_dir, sound_name, sound_dir / src_wav_path.name, sound_dir / src_metadata_path.name
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
 
-        shutil.rmtree(self.temp_dir)
+class TestRemoveAmbientCommand:
+    """Test remove_ambient_command function."""
 
+    @pytest.mark.parametrize(
+        "available",
+        [pytest.param(["campfire", "rain"], id="others_available"), pytest.param([], id="none")],
+    )
     @patch("sleepstack.commands.remove_ambient.get_ambient_manager")
-    def test_remove_ambient_not_found(self, mock_get_manager):
+    def test_remove_ambient_not_found(self, mock_get_manager, available):
         """Test removing an ambient sound that doesn't exist."""
         # Mock asset manager
         mock_manager = Mock()
         mock_get_manager.return_value = mock_manager
         mock_manager.get_sound_metadata.return_value = None
-        mock_manager.get_available_sounds.return_value = ["campfire", "rain"]
-
-        # Create args
-        args = Mock()
-        args.name = "nonexistent_sound"
-        args.force = False
-
-        # Test command
-        result = remove_ambient_command(args)
-
-        assert result == 1
-        mock_manager.get_sound_metadata.assert_called_once_with("nonexistent_sound")
-        mock_manager.get_available_sounds.assert_called_once()
-
-    @patch("sleepstack.commands.remove_ambient.get_ambient_manager")
-    def test_remove_ambient_not_found_no_available(self, mock_get_manager):
-        """Test removing an ambient sound when no sounds are available."""
-        # Mock asset manager
-        mock_manager = Mock()
-        mock_get_manager.return_value = mock_manager
-        mock_manager.get_sound_metadata.return_value = None
-        mock_manager.get_available_sounds.return_value = []
+        mock_manager.get_available_sounds.return_value = available
 
         # Create args
         args = Mock()
@@ -71,31 +106,22 @@ class TestRemoveAmbientCommand:
         mock_manager.get_sound_metadata.assert_called_once_with("nonexistent_sound")
         mock_manager.get_available_sounds.assert_called_once()
 
+    @patch("sleepstack.commands.remove_ambient.shutil.rmtree")
     @patch("sleepstack.commands.remove_ambient.input")
     @patch("sleepstack.commands.remove_ambient.get_ambient_manager")
-    def test_remove_ambient_with_confirmation_yes(self, mock_get_manager, mock_input):
+    def test_remove_ambient_with_confirmation_yes(
+        self, mock_get_manager, mock_input, mock_rmtree, tmp_path
+    ):
         """Test removing an ambient sound with user confirmation."""
         # Mock asset manager
         mock_manager = Mock()
         mock_get_manager.return_value = mock_manager
 
-        # Create mock metadata
-        sound_dir = self.assets_dir / "test_sound"
-        sound_dir.mkdir()
+        # Create mock metadata inside an existing directory; rmtree itself is mocked
+        sound_dir = tmp_path
         wav_path = sound_dir / "test_sound_1m.wav"
-        wav_path.touch()
-
-        metadata = AmbientSoundMetadata(
-            name="test_sound",
-            path=wav_path,
-            duration_seconds=60.0,
-            sample_rate=48000,
-            channels=2,
-            file_size_bytes=1000000,
-            created_date="2024-01-01T00:00:00Z",
-            source_url="https://example.com",
-            description="Test sound",
-        )
+
+        metadata = _metadata(wav_path)
 
         mock_manager.get_sound_metadata.return_value = metadata
         mock_manager.remove_sound_metadata.return_value = True
@@ -113,33 +139,24 @@ class TestRemoveAmbientCommand:
         mock_manager.get_sound_metadata.assert_called_once_with("test_sound")
         mock_manager.remove_sound_metadata.assert_called_once_with("test_sound")
         mock_input.assert_called_once()
-        assert not sound_dir.exists()
+        mock_rmtree.assert_called_once_with(sound_dir)
 
+    @patch("sleepstack.commands.remove_ambient.shutil.rmtree")
     @patch("sleepstack.commands.remove_ambient.input")
     @patch("sleepstack.commands.remove_ambient.get_ambient_manager")
-    def test_remove_ambient_with_confirmation_no(self, mock_get_manager, mock_input):
+    def test_remove_ambient_with_confirmation_no(
+        self, mock_get_manager, mock_input, mock_rmtree, tmp_path
+    ):
         """Test removing an ambient sound with user cancellation."""
         # Mock asset manager
         mock_manager = Mock()
         mock_get_manager.return_value = mock_manager
 
-        # Create mock metadata
-        sound_dir = self.assets_dir / "test_sound"
-        sound_dir.mkdir()
+        # Create mock metadata inside an existing directory; rmtree itself is mocked
+        sound_dir = tmp_path
         wav_path = sound_dir / "test_sound_1m.wav"
-        wav_path.touch()
-
-        metadata = AmbientSoundMetadata(
-            name="test_sound",
-            path=wav_path,
-            duration_seconds=60.0,
-            sample_rate=48000,
-            channels=2,
-            file_size_bytes=1000000,
-            created_date="2024-01-01T00:00:00Z",
-            source_url="https://example.com",
-            description="Test sound",
-        )
+
+        metadata = _metadata(wav_path)
 
         mock_manager.get_sound_metadata.return_value = metadata
         mock_input.return_value = "no"
@@ -156,155 +173,66 @@ class TestRemoveAmbientCommand:
         mock_manager.get_sound_metadata.assert_called_once_with("test_sound")
         mock_manager.remove_sound_metadata.assert_not_called()
         mock_input.assert_called_once()
-        assert sound_dir.exists()  # Directory should still exist
-
-    @patch("sleepstack.commands.remove_ambient.get_ambient_manager")
-    def test_remove_ambient_with_force(self, mock_get_manager):
-        """Test removing an ambient sound with --force flag."""
-        # Mock asset manager
-        mock_manager = Mock()
-        mock_get_manager.return_value = mock_manager
-
-        # Create mock metadata
-        sound_dir = self.assets_dir / "test_sound"
-        sound_dir.mkdir()
-        wav_path = sound_dir / "test_sound_1m.wav"
-        wav_path.touch()
-
-        metadata = AmbientSoundMetadata(
-            name="test_sound",
-            path=wav_path,
-            duration_seconds=60.0,
-            sample_rate=48000,
-            channels=2,
-            file_size_bytes=1000000,
-            created_date="2024-01-01T00:00:00Z",
-            source_url="https://example.com",
-            description="Test sound",
-        )
-
-        mock_manager.get_sound_metadata.return_value = metadata
-        mock_manager.remove_sound_metadata.return_value = True
-
-        # Create args
-        args = Mock()
-        args.name = "test_sound"
-        args.force = True
-
-        # Test command
-        result = remove_ambient_command(args)
-
-        assert result == 0
-        mock_manager.get_sound_metadata.assert_called_once_with("test_sound")
-        mock_manager.remove_sound_metadata.assert_called_once_with("test_sound")
-        assert not sound_dir.exists()
-
-    @patch("sleepstack.commands.remove_ambient.get_ambient_manager")
-    def test_remove_ambient_minimal_metadata(self, mock_get_manager):
-        """Test removing an ambient sound with minimal metadata."""
-        # Mock asset manager
-        mock_manager = Mock()
-        mock_get_manager.return_value = mock_manager
-
-        # Create mock metadata with minimal fields
-        sound_dir = self.assets_dir / "test_sound"
-        sound_dir.mkdir()
-        wav_path = sound_dir / "test_sound_1m.wav"
-        wav_path.touch()
-
-        metadata = AmbientSoundMetadata(
-            name="test_sound",
-            path=wav_path,
-            duration_seconds=60.0,
-            sample_rate=48000,
-            channels=2,
-            file_size_bytes=1000000,
-            created_date=None,
-            source_url=None,
-            description=None,
-        )
-
-        mock_manager.get_sound_metadata.return_value = metadata
-        mock_manager.remove_sound_metadata.return_value = True
-
-        # Create args
-        args = Mock()
-        args.name = "test_sound"
-        args.force = True
-
-        # Test command
-        result = remove_ambient_command(args)
-
-        assert result == 0
-        mock_manager.get_sound_metadata.assert_called_once_with("test_sound")
-        mock_manager.remove_sound_metadata.assert_called_once_with("test_sound")
-        assert not sound_dir.exists()
-
+        mock_rmtree.assert_not_called()  # Directory should be left alone
+
+    @pytest.mark.parametrize(
+        "created_date,source_url,description,remove_ret,make_dir",
+        [
+            pytest.param(
+                "2024-01-01T00:00:00Z",
+                "https://example.com",
+                "Test sound",
+                True,
+                True,
+                id="with_force",
+            ),
+            pytest.param(None, None, None, True, True, id="minimal_metadata"),
+            pytest.param(
+                "2024-01-01T00:00:00Z",
+                "https://example.com",
+                "Test sound",
+                False,
+                True,
+                id="metadata_removal_fails",
+            ),
+            pytest.param(
+                "2024-01-01T00:00:00Z",
+                "https://example.com",
+                "Test sound",
+                True,
+                False,
+                id="directory_not_exists",
+            ),
+        ],
+    )
+    @patch("sleepstack.commands.remove_ambient.shutil.rmtree")
     @patch("sleepstack.commands.remove_ambient.get_ambient_manager")
-    def test_remove_ambient_metadata_removal_fails(self, mock_get_manager):
-        """Test removing an ambient sound when metadata removal fails."""
+    def test_remove_ambient_forced(
+        self,
+        mock_get_manager,
+        mock_rmtree,
+        tmp_path,
+        created_date,
+        source_url,
+        description,
+        remove_ret,
+        make_dir,
+    ):
+        """Test removing an ambient sound with --force across metadata variants."""
         # Mock asset manager
         mock_manager = Mock()
         mock_get_manager.return_value = mock_manager
 
-        # Create mock metadata
-        sound_dir = self.assets_dir / "test_sound"
-        sound_dir.mkdir()
+        # Create mock metadata in an existing or non-existent directory; rmtree is mocked
+        sound_dir = tmp_path if make_dir else Path("/nonexistent/path")
         wav_path = sound_dir / "test_sound_1m.wav"
-        wav_path.touch()
-
-        metadata = AmbientSoundMetadata(
-            name="test_sound",
-            path=wav_path,
-            duration_seconds=60.0,
-            sample_rate=48000,
-            channels=2,
-            file_size_bytes=1000000,
-            created_date="2024-01-01T00:00:00Z",
-            source_url="https://example.com",
-            description="Test sound",
-        )
-
-        mock_manager.get_sound_metadata.return_value = metadata
-        mock_manager.remove_sound_metadata.return_value = False
-
-        # Create args
-        args = Mock()
-        args.name = "test_sound"
-        args.force = True
 
-        # Test command
-        result = remove_ambient_command(args)
-
-        assert result == 0  # Still returns 0 even if metadata removal fails
-        mock_manager.get_sound_metadata.assert_called_once_with("test_sound")
-        mock_manager.remove_sound_metadata.assert_called_once_with("test_sound")
-        assert not sound_dir.exists()  # Directory should still be removed
-
-    @patch("sleepstack.commands.remove_ambient.get_ambient_manager")
-    def test_remove_ambient_directory_not_exists(self, mock_get_manager):
-        """Test removing an ambient sound when directory doesn't exist."""
-        # Mock asset manager
-        mock_manager = Mock()
-        mock_get_manager.return_value = mock_manager
-
-        # Create mock metadata pointing to non-existent directory
-        wav_path = Path("/nonexistent/path/test_sound_1m.wav")
-
-        metadata = AmbientSoundMetadata(
-            name="test_sound",
-            path=wav_path,
-            duration_seconds=60.0,
-            sample_rate=48000,
-            channels=2,
-            file_size_bytes=1000000,
-            created_date="2024-01-01T00:00:00Z",
-            source_url="https://example.com",
-            description="Test sound",
+        metadata = _metadata(
+            wav_path, created_date=created_date, source_url=source_url, description=description
         )
 
         mock_manager.get_sound_metadata.return_value = metadata
-        mock_manager.remove_sound_metadata.return_value = True
+        mock_manager.remove_sound_metadata.return_value = remove_ret
 
         # Create args
         args = Mock()
@@ -314,31 +242,27 @@ class TestRemoveAmbientCommand:
         # Test command
         result = remove_ambient_command(args)
 
+        # Still returns 0 even if metadata removal fails
         assert result == 0
         mock_manager.get_sound_metadata.assert_called_once_with("test_sound")
         mock_manager.remove_sound_metadata.assert_called_once_with("test_sound")
-
-    @patch("sleepstack.commands.remove_ambient.get_ambient_manager")
-    def test_remove_ambient_ambient_sound_error(self, mock_get_manager):
-        """Test handling AmbientSoundError."""
-        # Mock asset manager to raise exception
-        mock_get_manager.side_effect = AmbientSoundError("Test ambient sound error")
-
-        # Create args
-        args = Mock()
-        args.name = "test_sound"
-        args.force = False
-
-        # Test command
-        result = remove_ambient_command(args)
-
-        assert result == 1
-
+        if make_dir:
+            mock_rmtree.assert_called_once_with(sound_dir)  # Directory should still be removed
+        else:
+            mock_rmtree.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            pytest.param(AmbientSoundError("Test ambient sound error"), id="ambient_sound_error"),
+            pytest.param(Exception("Unexpected error"), id="unexpected_error"),
+        ],
+    )
     @patch("sleepstack.commands.remove_ambient.get_ambient_manager")
-    def test_remove_ambient_unexpected_error(self, mock_get_manager):
-        """Test handling unexpected errors."""
+    def test_remove_ambient_error(self, mock_get_manager, exc):
+        """Test handling AmbientSoundError and unexpected errors."""
         # Mock asset manager to raise exception
-        mock_get_manager.side_effect = Exception("Unexpected error")
+        mock_get_manager.side_effect = exc
 
         # Create args
         args = Mock()
@@ -398,117 +322,29 @@ class TestAddRemoveAmbientParser:
 class TestIntegration:
     """Integration tests for remove_ambient command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.assets_dir = Path(self.temp_dir) / "ambience"
-        self.assets_dir.mkdir(parents=True)
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
-
-    @patch("sleepstack.commands.remove_ambient.get_ambient_manager")
-    def test_real_ambient_removal(self, mock_get_manager):
-        """Test with real ambient manager and files."""
-        from sleepstack.ambient_manager import AmbientSoundManager
-
-        # Use real ambient manager with temp directory
-        real_manager = AmbientSoundManager(self.assets_dir)
-        mock_get_manager.return_value = real_manager
-
-        # Create a real ambient sound
-        sound_name = "test_sound"
-        sound_dir = self.assets_dir / sound_name
-        sound_dir.mkdir()
-
-        # Create WAV file
-        wav_path = sound_dir / f"{sound_name}_1m.wav"
-        with wave.open(str(wav_path), "wb") as wf:
-            wf.setnchannels(2)
-            wf.setsampwidth(2)
-            wf.setframerate(48000)
-            wf.writeframes(b"\x00" * 48000 * 2 * 2 * 60)  # 60 seconds
-
-        # Create metadata
-        metadata_path = sound_dir / f"{sound_name}_metadata.json"
-        metadata = {
-            "name": sound_name,
-            "path": str(wav_path),
-            "duration_seconds": 60.0,
-            "sample_rate": 48000,
-            "channels": 2,
-            "file_size_bytes": wav_path.stat().st_size,
-            "created_date": "2024-01-01T00:00:00Z",
-            "last_modified": "2024-01-01T00:00:00Z",
-            "source_url": "https://example.com",
-            "description": "Test sound",
-        }
-
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f)
-
-        # Test removing with force
-        args = Mock()
-        args.name = sound_name
-        args.force = True
-
-        result = remove_ambient_command(args)
-        assert result == 0
-
-        # Verify files were removed
-        assert not wav_path.exists()
-        assert not metadata_path.exists()
-        assert not sound_dir.exists()
-
+    @pytest.mark.parametrize(
+        "force,input_val",
+        [pytest.param(True, None, id="force"), pytest.param(False, "yes", id="confirmation")],
+    )
     @patch("sleepstack.commands.remove_ambient.input")
     @patch("sleepstack.commands.remove_ambient.get_ambient_manager")
-    def test_real_ambient_removal_with_confirmation(self, mock_get_manager, mock_input):
-        """Test with real ambient manager and user confirmation."""
+    def test_real_ambient_removal(
+        self, mock_get_manager, mock_input, fresh_sound, force, input_val
+    ):
+        """Test with real ambient manager and files, with --force or user confirmation."""
         from sleepstack.ambient_manager import AmbientSoundManager
 
+        assets_dir, sound_name, wav_path, metadata_path = fresh_sound
+        sound_dir = wav_path.parent
+
         # Use real ambient manager with temp directory
-        real_manager = AmbientSoundManager(self.assets_dir)
+        real_manager = AmbientSoundManager(assets_dir)
         mock_get_manager.return_value = real_manager
-        mock_input.return_value = "yes"
+        mock_input.return_value = input_val
 
-        # Create a real ambient sound
-        sound_name = "test_sound"
-        sound_dir = self.assets_dir / sound_name
-        sound_dir.mkdir()
-
-        # Create WAV file
-        wav_path = sound_dir / f"{sound_name}_1m.wav"
-        with wave.open(str(wav_path), "wb") as wf:
-            wf.setnchannels(2)
-            wf.setsampwidth(2)
-            wf.setframerate(48000)
-            wf.writeframes(b"\x00" * 48000 * 2 * 2 * 60)  # 60 seconds
-
-        # Create metadata
-        metadata_path = sound_dir / f"{sound_name}_metadata.json"
-        metadata = {
-            "name": sound_name,
-            "path": str(wav_path),
-            "duration_seconds": 60.0,
-            "sample_rate": 48000,
-            "channels": 2,
-            "file_size_bytes": wav_path.stat().st_size,
-            "created_date": "2024-01-01T00:00:00Z",
-            "last_modified": "2024-01-01T00:00:00Z",
-            "source_url": "https://example.com",
-            "description": "Test sound",
-        }
-
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f)
-
-        # Test removing with confirmation
         args = Mock()
         args.name = sound_name
-        args.force = False
+        args.force = force
 
         result = remove_ambient_command(args)
         assert result == 0
@@ -517,4 +353,4 @@ class TestIntegration:
         assert not wav_path.exists()
         assert not metadata_path.exists()
         assert not sound_dir.exists()
-        mock_input.assert_called_once()
+        assert mock_input.call_count == (0 if force else 1)
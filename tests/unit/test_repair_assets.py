@@ -1,33 +1,46 @@
 """Tests for repair_assets.py"""
 
+import argparse
 import pytest
-import tempfile
-import json
 import wave
-from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 from sleepstack.commands.repair_assets import (
     repair_assets_command,
     add_repair_assets_parser,
 )
-from sleepstack.asset_manager import AssetValidationError
+from sleepstack.asset_manager import AssetManager, AssetValidationError
 
+# One second of 48 kHz, 16-bit stereo silence
+_SILENCE_1S = b"\x00" * 48000 * 2 * 2
 
-class TestRepairAssetsCommand:
-    """Test repair_assets_command function."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.assets_dir = Path(self.temp_dir) / "ambience"
-        self.assets_dir.mkdir(parents=True)
+@pytest.fixture(scope="module")
+def repair_parser():
+    """Return a real top-level parser with the repair-assets subcommand added."""
+    parser = argparse.ArgumentParser()
+    add_repair_assets_parser(parser.add_subparsers())
+    return parser
+
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
+@pytest.fixture
+def assets_dir(tmp_path):
+    """Return an empty ambience directory under this test's tmp_path."""
+    path = tmp_path / "ambience"
+    path.mkdir()
+    return path
 
-        shutil.rmtree(self.temp_dir)
+
+@pytest.fixture
+def real_manager(assets_dir):
+    """Return a real AssetManager rooted at this test's ambience directory."""
+    return AssetManager(assets_dir)
+
+
+@pytest.mark.xdist_group("mock")
+class TestRepairAssetsCommand:
+    """Test repair_assets_command function."""
 
     @patch("sleepstack.commands.repair_assets.get_asset_manager")
     def test_repair_specific_sound_success(self, mock_get_manager):
@@ -38,8 +51,7 @@ class TestRepairAssetsCommand:
         mock_manager.repair_asset.return_value = True
 
         # Create args
-        args = Mock()
-        args.sound_name = "campfire"
+        args = SimpleNamespace(sound_name="campfire")
 
         # Test command
         result = repair_assets_command(args)
@@ -56,8 +68,7 @@ class TestRepairAssetsCommand:
         mock_manager.repair_asset.return_value = False
 
         # Create args
-        args = Mock()
-        args.sound_name = "broken_sound"
+        args = SimpleNamespace(sound_name="broken_sound")
 
         # Test command
         result = repair_assets_command(args)
@@ -74,8 +85,7 @@ class TestRepairAssetsCommand:
         mock_manager.list_all_assets_with_status.return_value = []
 
         # Create args
-        args = Mock()
-        args.sound_name = None
+        args = SimpleNamespace(sound_name=None)
 
         # Test command
         result = repair_assets_command(args)
@@ -95,8 +105,7 @@ class TestRepairAssetsCommand:
         ]
 
         # Create args
-        args = Mock()
-        args.sound_name = None
+        args = SimpleNamespace(sound_name=None)
 
         # Test command
         result = repair_assets_command(args)
@@ -125,8 +134,7 @@ class TestRepairAssetsCommand:
         mock_manager.repair_asset.side_effect = repair_side_effect
 
         # Create args
-        args = Mock()
-        args.sound_name = None
+        args = SimpleNamespace(sound_name=None)
 
         # Test command
         result = repair_assets_command(args)
@@ -135,8 +143,8 @@ class TestRepairAssetsCommand:
         mock_manager.list_all_assets_with_status.assert_called_once()
         # Should call repair_asset for invalid assets only
         assert mock_manager.repair_asset.call_count == 2
-        mock_manager.repair_asset.assert_any_call("broken_sound1")
-        mock_manager.repair_asset.assert_any_call("broken_sound2")
+        repaired = {c.args[0] for c in mock_manager.repair_asset.call_args_list}
+        assert repaired == {"broken_sound1", "broken_sound2"}
 
     @patch("sleepstack.commands.repair_assets.get_asset_manager")
     def test_repair_all_assets_all_repaired(self, mock_get_manager):
@@ -153,8 +161,7 @@ class TestRepairAssetsCommand:
         mock_manager.repair_asset.return_value = True
 
         # Create args
-        args = Mock()
-        args.sound_name = None
+        args = SimpleNamespace(sound_name=None)
 
         # Test command
         result = repair_assets_command(args)
@@ -162,6 +169,8 @@ class TestRepairAssetsCommand:
         assert result == 0  # All repairs successful
         mock_manager.list_all_assets_with_status.assert_called_once()
         assert mock_manager.repair_asset.call_count == 2
+        repaired = {c.args[0] for c in mock_manager.repair_asset.call_args_list}
+        assert repaired == {"broken_sound1", "broken_sound2"}
 
     @patch("sleepstack.commands.repair_assets.get_asset_manager")
     def test_repair_assets_validation_error(self, mock_get_manager):
@@ -170,8 +179,7 @@ class TestRepairAssetsCommand:
         mock_get_manager.side_effect = AssetValidationError("Test validation error")
 
         # Create args
-        args = Mock()
-        args.sound_name = "test_sound"
+        args = SimpleNamespace(sound_name="test_sound")
 
         # Test command
         result = repair_assets_command(args)
@@ -185,8 +193,7 @@ class TestRepairAssetsCommand:
         mock_get_manager.side_effect = Exception("Unexpected error")
 
         # Create args
-        args = Mock()
-        args.sound_name = "test_sound"
+        args = SimpleNamespace(sound_name="test_sound")
 
         # Test command
         result = repair_assets_command(args)
@@ -194,6 +201,7 @@ class TestRepairAssetsCommand:
         assert result == 1
 
 
+@pytest.mark.xdist_group("mock")
 class TestAddRepairAssetsParser:
     """Test add_repair_assets_parser function."""
 
@@ -216,53 +224,29 @@ class TestAddRepairAssetsParser:
         assert mock_parser.add_argument.call_count == 1  # sound_name
         assert mock_parser.set_defaults.call_count == 1
 
-    def test_parser_arguments(self):
+    def test_parser_arguments(self, repair_parser):
         """Test that parser has correct arguments."""
-        import argparse
-
-        # Create real parser
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers()
-
-        # Add repair-assets parser
-        add_repair_assets_parser(subparsers)
-
         # Test parsing with sound name
-        args = parser.parse_args(["repair-assets", "campfire"])
+        args = repair_parser.parse_args(["repair-assets", "campfire"])
         assert args.sound_name == "campfire"
 
         # Test parsing without sound name
-        args = parser.parse_args(["repair-assets"])
+        args = repair_parser.parse_args(["repair-assets"])
         assert args.sound_name is None
 
 
+@pytest.mark.xdist_group("fs")
 class TestIntegration:
     """Integration tests for repair_assets command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.assets_dir = Path(self.temp_dir) / "ambience"
-        self.assets_dir.mkdir(parents=True)
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
-
     @patch("sleepstack.commands.repair_assets.get_asset_manager")
-    def test_real_asset_repair(self, mock_get_manager):
+    def test_real_asset_repair(self, mock_get_manager, assets_dir, real_manager):
         """Test with real asset manager and files."""
-        from sleepstack.asset_manager import AssetManager
-
-        # Use real asset manager with temp directory
-        real_manager = AssetManager(self.assets_dir)
         mock_get_manager.return_value = real_manager
 
         # Create a repairable asset (missing metadata)
         sound_name = "test_sound"
-        sound_dir = self.assets_dir / sound_name
+        sound_dir = assets_dir / sound_name
         sound_dir.mkdir()
 
         # Create valid WAV file but no metadata
@@ -271,11 +255,11 @@ class TestIntegration:
             wf.setnchannels(2)
             wf.setsampwidth(2)
             wf.setframerate(48000)
-            wf.writeframes(b"\x00" * 48000 * 2 * 2 * 60)  # 60 seconds
+            for _ in range(60):  # the validator expects ~60 seconds
+                wf.writeframes(_SILENCE_1S)
 
         # Test repairing specific sound
-        args = Mock()
-        args.sound_name = sound_name
+        args = SimpleNamespace(sound_name=sound_name)
 
         result = repair_assets_command(args)
         assert result == 0
@@ -290,33 +274,24 @@ class TestIntegration:
         assert result == 0
 
     @patch("sleepstack.commands.repair_assets.get_asset_manager")
-    def test_repair_nonexistent_asset(self, mock_get_manager):
+    def test_repair_nonexistent_asset(self, mock_get_manager, real_manager):
         """Test repairing nonexistent asset."""
-        from sleepstack.asset_manager import AssetManager
-
-        # Use real asset manager with temp directory
-        real_manager = AssetManager(self.assets_dir)
         mock_get_manager.return_value = real_manager
 
         # Test repairing nonexistent sound
-        args = Mock()
-        args.sound_name = "nonexistent_sound"
+        args = SimpleNamespace(sound_name="nonexistent_sound")
 
         result = repair_assets_command(args)
         assert result == 1
 
     @patch("sleepstack.commands.repair_assets.get_asset_manager")
-    def test_repair_corrupted_asset(self, mock_get_manager):
+    def test_repair_corrupted_asset(self, mock_get_manager, assets_dir, real_manager):
         """Test repairing corrupted asset that cannot be fixed."""
-        from sleepstack.asset_manager import AssetManager
-
-        # Use real asset manager with temp directory
-        real_manager = AssetManager(self.assets_dir)
         mock_get_manager.return_value = real_manager
 
         # Create a corrupted asset (no WAV file, corrupted metadata)
         sound_name = "corrupted_sound"
-        sound_dir = self.assets_dir / sound_name
+        sound_dir = assets_dir / sound_name
         sound_dir.mkdir()
 
         # Create corrupted metadata file
@@ -324,8 +299,7 @@ class TestIntegration:
         metadata_path.write_text("corrupted json")
 
         # Test repairing specific sound
-        args = Mock()
-        args.sound_name = sound_name
+        args = SimpleNamespace(sound_name=sound_name)
 
         result = repair_assets_command(args)
         assert result == 1  # Cannot repair without WAV file
@@ -2,9 +2,7 @@
 
 import pytest
 import json
-import tempfile
 from io import StringIO
-from pathlib import Path
 from unittest.mock import Mock, patch
 from click.testing import CliRunner
 
@@ -24,6 +22,9 @@ from sleepstack.commands.state_command import (
     clear,
 )
 
+# CliRunner.invoke isolates each call, so one runner serves every test
+_RUNNER = CliRunner()
+
 
 class TestStateCommand:
     """Test the state command group."""
@@ -38,10 +39,6 @@ class TestStateCommand:
 class TestStateShow:
     """Test the show command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
     @patch("sleepstack.commands.state_command.get_state_manager")
     def test_show_with_key(self, mock_get_manager):
         """Test show command with specific key."""
@@ -49,7 +46,7 @@ class TestStateShow:
         mock_manager.get_state.return_value = "download"
         mock_get_manager.return_value = mock_manager
 
-        result = self.runner.invoke(show, ["--key", "last_operation"])
+        result = _RUNNER.invoke(show, ["--key", "last_operation"])
         assert result.exit_code == 0
         assert "last_operation: download" in result.output
         mock_manager.get_state.assert_called_once_with("last_operation")
@@ -61,7 +58,7 @@ class TestStateShow:
         mock_manager.get_state.return_value = {}
         mock_get_manager.return_value = mock_manager
 
-        result = self.runner.invoke(show)
+        result = _RUNNER.invoke(show)
         assert result.exit_code == 0
         assert "No application state found" in result.output
 
@@ -76,7 +73,7 @@ class TestStateShow:
         }
         mock_get_manager.return_value = mock_manager
 
-        result = self.runner.invoke(show)
+        result = _RUNNER.invoke(show)
         assert result.exit_code == 0
         assert "last_operation" in result.output
         assert "total_assets" in result.output
@@ -85,17 +82,13 @@ class TestStateShow:
 class TestStateSet:
     """Test the set command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
     @patch("sleepstack.commands.state_command.get_state_manager")
     def test_set_command(self, mock_get_manager):
         """Test set command."""
         mock_manager = Mock()
         mock_get_manager.return_value = mock_manager
 
-        result = self.runner.invoke(set, ["last_operation", "download"])
+        result = _RUNNER.invoke(set, ["last_operation", "download"])
         assert result.exit_code == 0
         assert "Set last_operation = download" in result.output
         mock_manager.set_state.assert_called_once_with("last_operation", "download")
@@ -104,10 +97,6 @@ class TestStateSet:
 class TestStateDependencies:
     """Test the dependencies command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
     @patch("sleepstack.commands.state_command.get_state_manager")
     def test_dependencies_with_asset(self, mock_get_manager):
         """Test dependencies command with specific asset."""
@@ -120,7 +109,7 @@ class TestStateDependencies:
         mock_manager.get_dependents.return_value = []
         mock_get_manager.return_value = mock_manager
 
-        result = self.runner.invoke(dependencies, ["test_asset"])
+        result = _RUNNER.invoke(dependencies, ["test_asset"])
         assert result.exit_code == 0
         assert "mix" in result.output
         mock_manager.get_dependencies.assert_called_once_with("test_asset")
@@ -133,7 +122,7 @@ class TestStateDependencies:
         mock_manager.get_dependents.return_value = []
         mock_get_manager.return_value = mock_manager
 
-        result = self.runner.invoke(dependencies, ["test_asset"])
+        result = _RUNNER.invoke(dependencies, ["test_asset"])
         assert result.exit_code == 0
         assert "No dependencies found" in result.output
 
@@ -141,10 +130,6 @@ class TestStateDependencies:
 class TestStateReferences:
     """Test the references command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
     @patch("sleepstack.commands.state_command.get_state_manager")
     def test_references_command(self, mock_get_manager):
         """Test references command."""
@@ -157,7 +142,7 @@ class TestStateReferences:
         mock_manager.get_asset_references.return_value = [mock_ref]
         mock_get_manager.return_value = mock_manager
 
-        result = self.runner.invoke(references, ["test_asset"])
+        result = _RUNNER.invoke(references, ["test_asset"])
         assert result.exit_code == 0
         assert "download" in result.output
         mock_manager.get_asset_references.assert_called_once_with("test_asset")
@@ -166,10 +151,6 @@ class TestStateReferences:
 class TestStateMaintenance:
     """Test the maintenance command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
     @patch("sleepstack.commands.state_command.get_state_manager")
     def test_maintenance_command(self, mock_get_manager):
         """Test maintenance command."""
@@ -184,7 +165,7 @@ class TestStateMaintenance:
         mock_manager.get_maintenance_records.return_value = [mock_record]
         mock_get_manager.return_value = mock_manager
 
-        result = self.runner.invoke(maintenance)
+        result = _RUNNER.invoke(maintenance)
         assert result.exit_code == 0
         assert "download" in result.output
         mock_manager.get_maintenance_records.assert_called_once_with(20)
@@ -193,10 +174,6 @@ class TestStateMaintenance:
 class TestStateStats:
     """Test the stats command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
     @patch("sleepstack.commands.state_command.get_state_manager")
     def test_stats_command(self, mock_get_manager):
         """Test stats command."""
@@ -210,7 +187,7 @@ class TestStateStats:
         }
         mock_get_manager.return_value = mock_manager
 
-        result = self.runner.invoke(stats)
+        result = _RUNNER.invoke(stats)
         assert result.exit_code == 0
         assert "10" in result.output
         mock_manager.get_maintenance_stats.assert_called_once()
@@ -219,10 +196,6 @@ class TestStateStats:
 class TestStateHealth:
     """Test the health command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
     @patch("sleepstack.commands.state_command.get_state_manager")
     def test_health_command(self, mock_get_manager):
         """Test health command."""
@@ -237,7 +210,7 @@ class TestStateHealth:
         }
         mock_get_manager.return_value = mock_manager
 
-        result = self.runner.invoke(health)
+        result = _RUNNER.invoke(health)
         assert result.exit_code == 0
         assert "10" in result.output
         mock_manager.get_asset_health_summary.assert_called_once()
@@ -246,10 +219,6 @@ class TestStateHealth:
 class TestStateValidate:
     """Test the validate command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
     @patch("sleepstack.commands.state_command.get_state_manager")
     def test_validate_command(self, mock_get_manager):
         """Test validate command."""
@@ -257,7 +226,7 @@ class TestStateValidate:
         mock_manager.validate_asset_integrity.return_value = (True, [])
         mock_get_manager.return_value = mock_manager
 
-        result = self.runner.invoke(validate, ["test_asset"])
+        result = _RUNNER.invoke(validate, ["test_asset"])
         assert result.exit_code == 0
         assert "is valid" in result.output
         mock_manager.validate_asset_integrity.assert_called_once_with("test_asset")
@@ -266,10 +235,6 @@ class TestStateValidate:
 class TestStateCleanup:
     """Test the cleanup command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
     @patch("sleepstack.commands.state_command.get_state_manager")
     def test_cleanup_command(self, mock_get_manager):
         """Test cleanup command."""
@@ -277,7 +242,7 @@ class TestStateCleanup:
         mock_manager.cleanup_old_records.return_value = 5
         mock_get_manager.return_value = mock_manager
 
-        result = self.runner.invoke(cleanup)
+        result = _RUNNER.invoke(cleanup)
         assert result.exit_code == 0
         assert "Removed 5 old maintenance records" in result.output
         mock_manager.cleanup_old_records.assert_called_once_with(30)  # default days
@@ -286,67 +251,41 @@ class TestStateCleanup:
 class TestStateExport:
     """Test the export command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-        self.temp_dir = tempfile.mkdtemp()
-        self.export_path = Path(self.temp_dir) / "state_export.json"
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
-
     @patch("sleepstack.commands.state_command.get_state_manager")
-    def test_export_command(self, mock_get_manager):
+    def test_export_command(self, mock_get_manager, tmp_path):
         """Test export command."""
+        export_path = tmp_path / "state_export.json"
         mock_manager = Mock()
         mock_get_manager.return_value = mock_manager
 
-        result = self.runner.invoke(export, [str(self.export_path)])
+        result = _RUNNER.invoke(export, [str(export_path)])
         assert result.exit_code == 0
-        assert f"State exported to {self.export_path}" in result.output
-        mock_manager.export_state.assert_called_once_with(self.export_path)
+        assert f"State exported to {export_path}" in result.output
+        mock_manager.export_state.assert_called_once_with(export_path)
 
 
 class TestStateImport:
     """Test the import command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-        self.temp_dir = tempfile.mkdtemp()
-        self.import_path = Path(self.temp_dir) / "state_import.json"
-        self.import_path.write_text('{"test": "data"}')
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
-
     @patch("sleepstack.commands.state_command.get_state_manager")
-    def test_import_command(self, mock_get_manager):
+    def test_import_command(self, mock_get_manager, tmp_path):
         """Test import command."""
+        import_path = tmp_path / "state_import.json"
+        import_path.write_text('{"test": "data"}')
         mock_manager = Mock()
         mock_get_manager.return_value = mock_manager
 
         # Mock click.confirm to return True (user confirms)
         with patch("click.confirm", return_value=True):
-            result = self.runner.invoke(import_state, [str(self.import_path)])
+            result = _RUNNER.invoke(import_state, [str(import_path)])
             assert result.exit_code == 0
-            assert f"State imported from {self.import_path}" in result.output
+            assert f"State imported from {import_path}" in result.output
             mock_manager.import_state.assert_called_once()
 
 
 class TestStateClear:
     """Test the clear command."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
     @patch("sleepstack.commands.state_command.get_state_manager")
     def test_clear_command(self, mock_get_manager):
         """Test clear command."""
@@ -355,7 +294,7 @@ class TestStateClear:
 
         # Mock click.confirm to return True (user confirms)
         with patch("click.confirm", return_value=True):
-            result = self.runner.invoke(clear)
+            result = _RUNNER.invoke(clear)
             assert result.exit_code == 0
             assert "Application state cleared" in result.output
             mock_manager.clear_state.assert_called_once()